@@ -394,6 +394,8 @@ class BoardPacketGenerator:
         tenant_id: Optional[UUID] = None,
         meeting_date: Optional[date] = None,
         page_count: Optional[int] = None,
+        pdf_size_bytes: Optional[int] = None,
+        generation_time_seconds: Optional[int] = None,
     ) -> BoardPacket:
         """Create a board packet that is ready."""
         return BoardPacketGenerator.create(
@@ -401,6 +403,8 @@ class BoardPacketGenerator:
             meeting_date=meeting_date,
             status=BoardPacketStatus.READY,
             page_count=page_count,
+            pdf_size_bytes=pdf_size_bytes,
+            generation_time_seconds=generation_time_seconds,
         )
 
     @staticmethod
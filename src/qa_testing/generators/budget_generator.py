@@ -11,6 +11,14 @@ from qa_testing.models import Budget, BudgetLine, BudgetStatus, VarianceReport,
 
 fake = Faker()
 
+# Money constants used by the variance calculations (parsed once at import)
+ZERO = Decimal("0.00")
+CENT = Decimal("0.01")
+HUNDRED = Decimal("100")
+
+# A line is on track while its variance stays within this percentage of budget
+ON_TRACK_VARIANCE_PCT = Decimal("5.00")
+
 
 class BudgetGenerator:
     """
@@ -252,14 +260,11 @@ class BudgetGenerator:
         if total_actual is None:
             # Actual is typically 70-110% of budget
             variance_factor = Decimal(str(fake.random.uniform(0.7, 1.1)))
-            total_actual = (total_budgeted * variance_factor).quantize(Decimal("0.01"))
+            total_actual = (total_budgeted * variance_factor).quantize(CENT)
 
-        total_variance = total_budgeted - total_actual
-        variance_percentage = (
-            (total_variance / total_budgeted * Decimal("100"))
-            if total_budgeted != 0
-            else Decimal("0.00")
-        ).quantize(Decimal("0.01"))
+        total_variance, variance_percentage = BudgetGenerator.calculate_variance(
+            total_budgeted, total_actual
+        )
 
         return VarianceReport(
             tenant_id=tenant_id,
@@ -304,19 +309,14 @@ class BudgetGenerator:
         # Generate actual amount if not provided
         if actual is None:
             variance_factor = Decimal(str(fake.random.uniform(0.7, 1.1)))
-            actual = (budgeted * variance_factor).quantize(Decimal("0.01"))
+            actual = (budgeted * variance_factor).quantize(CENT)
 
-        variance = budgeted - actual
-        variance_percentage = (
-            (variance / budgeted * Decimal("100"))
-            if budgeted != 0
-            else Decimal("0.00")
-        ).quantize(Decimal("0.01"))
+        variance, variance_percentage = BudgetGenerator.calculate_variance(budgeted, actual)
 
         # Determine status
-        if abs(variance_percentage) <= Decimal("5.00"):
+        if abs(variance_percentage) <= ON_TRACK_VARIANCE_PCT:
             status = "on_track"
-        elif variance > Decimal("0.00"):
+        elif variance > ZERO:
             status = "favorable"
         else:
             status = "unfavorable"
@@ -333,6 +333,30 @@ class BudgetGenerator:
             status=status,
         )
 
+    @staticmethod
+    def calculate_variance(budgeted: Decimal, actual: Decimal) -> tuple[Decimal, Decimal]:
+        """
+        Calculate budget variance and variance percentage.
+
+        Positive variance means under budget (favorable).
+
+        Args:
+            budgeted: Budgeted amount
+            actual: Actual amount
+
+        Returns:
+            Tuple of (variance, variance_percentage), percentage quantized to 2 places
+            (0.00 when nothing was budgeted)
+        """
+        variance = budgeted - actual
+        variance_percentage = (
+            (variance / budgeted * HUNDRED)
+            if budgeted != 0
+            else ZERO
+        ).quantize(CENT)
+
+        return variance, variance_percentage
+
     @staticmethod
     def _generate_notes(fiscal_year: int) -> str:
         """Generate realistic budget notes."""
@@ -11,6 +11,7 @@ These generators create test scenarios for edge cases that commonly cause bugs:
 
 from datetime import date, timedelta
 from decimal import Decimal
+from functools import lru_cache
 from typing import Optional
 from uuid import UUID
 
@@ -20,6 +21,14 @@ from qa_testing.models import Transaction, TransactionType
 
 fake = Faker()
 
+# Cache size for the pure date helpers: comfortably covers every
+# (year, month) pair over a century
+DATE_CACHE_SIZE = 2048
+
+# Month a fiscal year ends in, indexed by start month - 1 (a January start
+# ends in December; every other start ends the month before)
+FISCAL_YEAR_END_MONTH = (12, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11)
+
 
 class EdgeCaseGenerator:
     """
@@ -37,10 +46,13 @@ class EdgeCaseGenerator:
     """
 
     @staticmethod
+    @lru_cache(maxsize=DATE_CACHE_SIZE)
     def leap_year_date(year: Optional[int] = None) -> date:
         """
         Generate February 29 date for a leap year.
 
+        Results are cached (dates are immutable, so sharing them is safe).
+
         Args:
             year: Leap year (must be divisible by 4, with century rules)
                  Defaults to 2024
@@ -79,9 +91,10 @@ class EdgeCaseGenerator:
         return (year % 4 == 0 and year % 100 != 0) or (year % 400 == 0)
 
     @staticmethod
+    @lru_cache(maxsize=DATE_CACHE_SIZE)
     def month_end_date(year: int, month: int) -> date:
         """
-        Generate the last day of a month.
+        Generate the last day of a month (cached per (year, month)).
 
         Args:
             year: Year
@@ -112,6 +125,7 @@ class EdgeCaseGenerator:
         return date(year, 12, 31)
 
     @staticmethod
+    @lru_cache(maxsize=DATE_CACHE_SIZE)
     def fiscal_year_boundary_date(
         year: int,
         fiscal_year_start_month: int,
@@ -127,25 +141,22 @@ class EdgeCaseGenerator:
 
         Returns:
             Fiscal year boundary date
+
+        Raises:
+            ValueError: If fiscal_year_start_month is not 1-12
         """
+        if not 1 <= fiscal_year_start_month <= 12:
+            raise ValueError("month must be in 1..12")
+
         if is_start:
             # First day of fiscal year
             return date(year, fiscal_year_start_month, 1)
-        else:
-            # Last day of fiscal year (day before next fiscal year starts)
-            if fiscal_year_start_month == 1:
-                # Fiscal year = calendar year
-                return date(year, 12, 31)
-            else:
-                # Last day of month before next fiscal year
-                next_fy_month = fiscal_year_start_month
-                next_fy_year = year + 1
-
-                # Get last day of previous month
-                first_day_next_fy = date(next_fy_year, next_fy_month, 1)
-                last_day_current_fy = first_day_next_fy - timedelta(days=1)
-
-                return last_day_current_fy
+
+        # Last day of fiscal year: a calendar fiscal year ends in the same
+        # year, any other fiscal year ends in the following one
+        end_month = FISCAL_YEAR_END_MONTH[fiscal_year_start_month - 1]
+        end_year = year if fiscal_year_start_month == 1 else year + 1
+        return EdgeCaseGenerator.month_end_date(end_year, end_month)
 
     @staticmethod
     def fiscal_year_boundary_transaction(
@@ -265,6 +265,45 @@ class TransactionGenerator:
             is_posted=is_posted,
         )
 
+    @staticmethod
+    def create_payment_batch(
+        count: int,
+        *,
+        property_id: UUID,
+        member_id: UUID,
+        amount: Decimal,
+        tenant_id: Optional[UUID] = None,
+        **kwargs
+    ) -> list[Transaction]:
+        """
+        Create a batch of payment transactions sharing the same payer and amount.
+
+        The tenant is resolved once for the whole batch instead of per payment.
+
+        Args:
+            count: Number of payments to create
+            property_id: Property ID for all payments
+            member_id: Member making every payment
+            amount: Amount of each payment
+            tenant_id: Tenant ID for all payments
+            **kwargs: Additional arguments passed to create_payment()
+
+        Returns:
+            List of payment Transaction instances
+        """
+        tenant_id = tenant_id or uuid4()
+
+        return [
+            TransactionGenerator.create_payment(
+                tenant_id=tenant_id,
+                property_id=property_id,
+                member_id=member_id,
+                amount=amount,
+                **kwargs
+            )
+            for _ in range(count)
+        ]
+
     @staticmethod
     def create_batch(
         count: int,
@@ -419,6 +458,36 @@ class LedgerEntryGenerator:
             description=f"Payment: {transaction.description}",
         )
 
+    @staticmethod
+    def create_for_payment_batch(
+        *,
+        tenant_id: Optional[UUID] = None,
+        property_id: UUID,
+        transactions: list[Transaction],
+        fund_id: UUID,
+    ) -> list[tuple[LedgerEntry, LedgerEntry]]:
+        """
+        Create balanced ledger entries for a batch of payment transactions.
+
+        Args:
+            tenant_id: Tenant ID
+            property_id: Property ID
+            transactions: Payment transactions
+            fund_id: Fund ID
+
+        Returns:
+            List of (debit_entry, credit_entry) tuples, one per transaction
+        """
+        return [
+            LedgerEntryGenerator.create_for_payment(
+                tenant_id=tenant_id,
+                property_id=property_id,
+                transaction=transaction,
+                fund_id=fund_id,
+            )
+            for transaction in transactions
+        ]
+
     @staticmethod
     def create_for_expense(
         *,
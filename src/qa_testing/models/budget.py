@@ -8,7 +8,7 @@ from uuid import UUID
 
 from pydantic import Field, field_validator
 
-from .base import AccountingDate, BaseTestModel, MoneyAmount
+from .base import AccountingDate, BaseTestModel, MoneyAmount, money_amount
 
 
 class BudgetStatus(str, Enum):
@@ -138,10 +138,10 @@ class BudgetLine(BaseTestModel):
     @field_validator("budgeted_amount")
     @classmethod
     def validate_budgeted_amount(cls, v):
-        """Ensure budgeted amount is non-negative."""
+        """Ensure budgeted amount is non-negative, stored with exactly 2 decimal places."""
         if v < Decimal("0.00"):
             raise ValueError("budgeted_amount cannot be negative")
-        return v
+        return money_amount(v)
 
 
 class VarianceReport(BaseTestModel):
@@ -5,6 +5,7 @@ These validators ensure that transactions and ledger entries
 follow proper accounting principles, especially double-entry bookkeeping.
 """
 
+from datetime import date
 from decimal import Decimal
 from typing import Optional
 
@@ -179,6 +180,32 @@ class TransactionValidator:
         Raises:
             ValidationError: If validation fails
         """
+        return TransactionValidator._check_transaction(transaction, date.today())
+
+    @staticmethod
+    def validate_batch(transactions: list[Transaction]) -> list[bool]:
+        """
+        Validate a list of transactions against the validate_transaction rules.
+
+        Today's date is looked up once for the whole batch rather than once
+        per transaction.
+
+        Args:
+            transactions: Transactions to validate
+
+        Returns:
+            One True per transaction, in order
+
+        Raises:
+            ValidationError: On the first transaction that fails validation
+        """
+        today = date.today()
+        check = TransactionValidator._check_transaction
+        return [check(transaction, today) for transaction in transactions]
+
+    @staticmethod
+    def _check_transaction(transaction: Transaction, today: date) -> bool:
+        """Apply the validate_transaction rules, using `today` for the future-date check."""
         # Check amount is positive
         if transaction.amount <= Decimal("0.00"):
             raise ValidationError(
@@ -205,8 +232,7 @@ class TransactionValidator:
             )
 
         # Check transaction_date is not in future
-        from datetime import date
-        if transaction.transaction_date > date.today():
+        if transaction.transaction_date > today:
             raise ValidationError(
                 f"Transaction {transaction.id} has future transaction_date: {transaction.transaction_date}"
             )
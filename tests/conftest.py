@@ -5,8 +5,11 @@ This file is automatically loaded by pytest and provides
 shared fixtures and configuration for all tests.
 """
 
+import os
+
 import pytest
-from hypothesis import settings
+from hypothesis import Phase, settings
+from hypothesis.database import DirectoryBasedExampleDatabase
 
 # Configure Hypothesis settings for financial testing
 settings.register_profile(
@@ -16,5 +19,52 @@ settings.register_profile(
     print_blob=True,  # Print failing examples
 )
 
-# Use the financial profile by default
-settings.load_profile("financial")
+# CI profile: same coverage as "financial", but deterministic so every run
+# tests the same examples, with no example database to read or write
+settings.register_profile(
+    "ci",
+    parent=settings.get_profile("financial"),
+    derandomize=True,
+    database=None,
+    deadline=None,  # Shared runners have noisy timings
+)
+
+# Dev profile: fast local runs; most invariants here have small input spaces
+# that 20 examples already cover (CI keeps the full example count). Shrinking
+# is skipped; rerun with HYPOTHESIS_PROFILE=financial for a minimal example.
+settings.register_profile(
+    "dev",
+    max_examples=20,
+    deadline=None,
+    print_blob=True,
+    phases=[Phase.explicit, Phase.reuse, Phase.generate],
+)
+
+# Generator-driven audit trail tests (tests/property/test_audit_trail.py) size
+# their batches from AUDIT_BATCH_N: 3 by default for fast local runs, while CI
+# sets AUDIT_BATCH_N=10 for the full-size batches.
+
+# Use the dev profile by default (CI sets HYPOTHESIS_PROFILE=ci; use
+# HYPOTHESIS_PROFILE=financial for a full-strength local run)
+HYPOTHESIS_PROFILE = os.getenv("HYPOTHESIS_PROFILE", "dev")
+settings.load_profile(HYPOTHESIS_PROFILE)
+
+
+def pytest_configure(config):
+    """
+    Keep Hypothesis's example database in pytest's cache directory.
+
+    Failing examples are then replayed first on the next run, and
+    `pytest --cache-clear` resets them along with the rest of pytest's cache.
+    Profiles without a database (ci is derandomized) are left alone.
+    """
+    cache = getattr(config, "cache", None)
+    if cache is None or settings.default.database is None:
+        return
+
+    settings.register_profile(
+        HYPOTHESIS_PROFILE,
+        parent=settings.get_profile(HYPOTHESIS_PROFILE),
+        database=DirectoryBasedExampleDatabase(str(cache.mkdir("hypothesis"))),
+    )
+    settings.load_profile(HYPOTHESIS_PROFILE)
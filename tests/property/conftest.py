@@ -0,0 +1,13 @@
+"""
+Fixtures shared by the property-based test modules.
+"""
+
+import pytest
+
+from qa_testing.generators import PropertyGenerator
+
+
+@pytest.fixture(scope="module")
+def tenant_id():
+    """Tenant ID shared by every test in a module (only the ID is used)."""
+    return PropertyGenerator.create().tenant_id
@@ -14,10 +14,20 @@ Critical invariants:
 from decimal import Decimal
 
 import pytest
-from hypothesis import given
+from hypothesis import given, settings
 
 from tests.strategies import fund_strategy, ledger_entry_pair_strategy, money_amount_strategy
 
+# Example cap for the ledger ID/reversal checks, which are type-level and
+# don't benefit from more input diversity
+STRUCTURAL_MAX_EXAMPLES = 20
+
+# Decimal literals used across tests (parsed once at import)
+ZERO = Decimal("0.00")
+CENT = Decimal("0.01")
+TWO = Decimal("2")
+HUNDRED = Decimal("100")
+
 
 class TestDoubleEntryBookkeeping:
     """Tests for double-entry bookkeeping invariants."""
@@ -81,11 +91,14 @@ class TestFundBalanceInvariants:
 
     @pytest.mark.property
     @given(fund_strategy())
-    def test_fund_balance_respects_minimum(self, fund):
+    def test_fund_invariants(self, fund):
         """
-        Property: For ANY fund, current balance must be >= minimum balance.
+        Property: For ANY fund, the balance, target, and funding percentage invariants hold.
 
-        Unless explicitly allowed, funds should never go below their minimum balance.
+        One drawn fund is checked against all fund invariants:
+        - Balance >= minimum balance (unless negatives are explicitly allowed)
+        - Target balance is positive or None (negative targets don't make sense)
+        - funding_percentage matches current / target * 100
         """
         if not fund.allow_negative_balance:
             # INVARIANT: Balance >= minimum balance (when negatives not allowed)
@@ -94,39 +107,25 @@ class TestFundBalanceInvariants:
                 f"Current: {fund.current_balance}, Minimum: {fund.minimum_balance}"
             )
 
-    @pytest.mark.property
-    @given(fund_strategy())
-    def test_target_balance_is_positive_or_none(self, fund):
-        """
-        Property: For ANY fund with a target balance, target must be positive or None.
-
-        Negative target balances don't make sense.
-        """
-        if fund.target_balance is not None:
-            # INVARIANT: Target balance must be positive
-            assert fund.target_balance > Decimal("0.00"), (
-                f"Invalid target balance! "
-                f"Target: {fund.target_balance} (must be positive or None)"
-            )
+        if fund.target_balance is None:
+            return
 
-    @pytest.mark.property
-    @given(fund_strategy())
-    def test_funding_percentage_calculation(self, fund):
-        """
-        Property: For ANY fund with a target balance, funding percentage must be accurate.
+        # INVARIANT: Target balance must be positive
+        assert fund.target_balance > ZERO, (
+            f"Invalid target balance! "
+            f"Target: {fund.target_balance} (must be positive or None)"
+        )
 
-        Validates the funding_percentage property calculation.
-        """
-        if fund.target_balance is not None and fund.target_balance > Decimal("0.00"):
-            expected_percentage = (fund.current_balance / fund.target_balance) * 100
-            actual_percentage = fund.funding_percentage
+        expected_percentage = (fund.current_balance / fund.target_balance) * HUNDRED
+        actual_percentage = fund.funding_percentage
 
-            # INVARIANT: Funding percentage calculation must be correct
-            assert actual_percentage is not None
-            assert abs(float(actual_percentage) - float(expected_percentage)) < 0.01, (
-                f"Funding percentage calculation error! "
-                f"Expected: {expected_percentage:.2f}%, Actual: {actual_percentage:.2f}%"
-            )
+        # INVARIANT: Funding percentage calculation must be correct
+        # (compared in Decimal space; Decimal(float) is an exact conversion)
+        assert actual_percentage is not None
+        assert abs(Decimal(actual_percentage) - expected_percentage) < CENT, (
+            f"Funding percentage calculation error! "
+            f"Expected: {expected_percentage:.2f}%, Actual: {actual_percentage:.2f}%"
+        )
 
 
 class TestMoneyAmountInvariants:
@@ -141,7 +140,7 @@ class TestMoneyAmountInvariants:
         This is CRITICAL for financial correctness. Floating-point errors are unacceptable.
         """
         # INVARIANT: Money amounts must have exactly 2 decimal places
-        quantized = amount.quantize(Decimal("0.01"))
+        quantized = amount.quantize(CENT)
         assert amount == quantized, (
             f"Money amount precision error! "
             f"Amount: {amount} (should have exactly 2 decimal places)"
@@ -170,8 +169,8 @@ class TestMoneyAmountInvariants:
         This validates that our money arithmetic doesn't introduce precision errors.
         """
         # Perform some arithmetic
-        doubled = amount * Decimal("2")
-        halved = doubled / Decimal("2")
+        doubled = amount * TWO
+        halved = doubled / TWO
 
         # INVARIANT: Arithmetic must preserve precision
         assert halved == amount, (
@@ -191,6 +190,7 @@ class TestLedgerImmutability:
 
     @pytest.mark.property
     @given(ledger_entry_pair_strategy())
+    @settings(max_examples=STRUCTURAL_MAX_EXAMPLES, deadline=None)
     def test_ledger_entries_created_with_id(self, entry_pair):
         """
         Property: For ANY ledger entry, it must have a unique ID upon creation.
@@ -211,6 +211,7 @@ class TestLedgerImmutability:
 
     @pytest.mark.property
     @given(ledger_entry_pair_strategy())
+    @settings(max_examples=STRUCTURAL_MAX_EXAMPLES, deadline=None)
     def test_reversing_entries_reference_original(self, entry_pair):
         """
         Property: For ANY reversing entry, it must reference the original entry.
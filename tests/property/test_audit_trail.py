@@ -5,21 +5,133 @@ These tests validate that the audit trail (ledger entries) is immutable
 and maintains complete history for compliance.
 """
 
+import os
+from datetime import date, timedelta
 from decimal import Decimal
+from typing import NamedTuple
+from uuid import UUID
 
 import pytest
-from hypothesis import given
+from hypothesis import given, settings
 
 from qa_testing.generators import LedgerEntryGenerator, PropertyGenerator, TransactionGenerator
+from qa_testing.models import LedgerEntry, Property, Transaction
 from qa_testing.validators import AccountingValidator, ReconciliationValidator, ValidationError
 from tests.strategies import ledger_entry_pair_strategy
 
+# Immutability checks are structural: they fail on code regressions, not on
+# data diversity, so a small example count gives the same coverage
+STRUCTURAL_MAX_EXAMPLES = 20
+
+# Money literals used across tests (parsed once at import)
+ZERO = Decimal("0.00")
+PAYMENT_AMOUNT = Decimal("300.00")
+REFUND_AMOUNT = Decimal("150.00")
+SHORT_AMOUNT = Decimal("250.00")
+TAMPER_AMOUNT = Decimal("100.00")
+
+# Batch sizes for the generator-driven (non-@given) tests: small for local runs,
+# CI sets AUDIT_BATCH_N=10 (see tests/conftest.py)
+AUDIT_BATCH_N = int(os.environ.get("AUDIT_BATCH_N", 3))
+PAYMENT_COUNT = max(2, AUDIT_BATCH_N // 2)
+REFUND_COUNT = max(1, AUDIT_BATCH_N // 5)
+
+# Dates for the chronological-order test (one payment per week)
+BASE_DATE = date(2024, 1, 1)
+WEEK = timedelta(days=7)
+
+
+def _is_monotonic(values: list) -> bool:
+    """Return True if values never decrease (single pass, stops at first violation)."""
+    return all(values[i] <= values[i + 1] for i in range(len(values) - 1))
+
+
+class PaymentBatch(NamedTuple):
+    """Posted payments and their ledger entries for one property/fund."""
+
+    property: Property
+    fund_id: UUID
+    transactions: list[Transaction]
+    entries: list[LedgerEntry]
+    entry_transaction_ids: set[UUID]
+    cash_entries: list[LedgerEntry]
+
+
+@pytest.fixture(scope="module")
+def payment_batch():
+    """
+    Create AUDIT_BATCH_N posted $300 payments with ledger entries, once per module.
+
+    Shared by the completeness and reconciliation tests, which only read it.
+    """
+    property = PropertyGenerator.create()
+    fund = PropertyGenerator.create().id  # Mock fund
+
+    transactions = TransactionGenerator.create_payment_batch(
+        AUDIT_BATCH_N,
+        property_id=property.id,
+        member_id=property.id,
+        fund_id=fund,
+        amount=PAYMENT_AMOUNT,
+        is_posted=True,
+    )
+
+    # Track which transactions have entries as the entries are collected.
+    # Payments always debit Cash (1000), so the cash side is the debit.
+    entries = []
+    entry_transaction_ids = set()
+    cash_entries = []
+    for debit, credit in LedgerEntryGenerator.create_for_payment_batch(
+        property_id=property.id,
+        transactions=transactions,
+        fund_id=fund,
+    ):
+        entries.extend((debit, credit))
+        entry_transaction_ids.add(debit.transaction_id)
+        entry_transaction_ids.add(credit.transaction_id)
+        cash_entries.append(debit)
+
+    return PaymentBatch(
+        property, fund, transactions, entries, entry_transaction_ids, cash_entries
+    )
+
+
+@pytest.fixture(scope="module")
+def refund_cash_entries(payment_batch):
+    """
+    Create REFUND_COUNT $150 refunds against the payment batch's property and fund.
+
+    Builds on the cached payment batch so the payment loop is not re-run.
+    Returns only the cash side of each refund (refunds always credit Cash).
+    """
+    property = payment_batch.property
+    fund = payment_batch.fund_id
+
+    cash_entries = []
+    for i in range(REFUND_COUNT):
+        txn = TransactionGenerator.create_refund(
+            property_id=property.id,
+            member_id=property.id,
+            fund_id=fund,
+            amount=REFUND_AMOUNT,
+        )
+
+        _, credit = LedgerEntryGenerator.create_for_refund(
+            property_id=property.id,
+            transaction=txn,
+            fund_id=fund,
+        )
+        cash_entries.append(credit)
+
+    return cash_entries
+
 
 class TestLedgerImmutability:
     """Tests for ledger entry immutability."""
 
     @pytest.mark.property
     @given(ledger_entry_pair_strategy())
+    @settings(max_examples=STRUCTURAL_MAX_EXAMPLES, deadline=None)
     def test_ledger_entry_never_modified(self, entry_pair):
         """
         Property: For ANY ledger entry, it should never be modified after creation.
@@ -28,26 +140,30 @@ class TestLedgerImmutability:
         """
         debit, _ = entry_pair
 
-        # Create a copy to represent "original" state
-        original = type(debit)(**debit.model_dump())
+        # Create a copy to represent "original" state (already validated, so skip revalidation)
+        original = type(debit).model_construct(**debit.model_dump())
 
         # Validate immutability (should pass for identical entry)
         assert AccountingValidator.validate_ledger_immutability(original, debit)
 
     @pytest.mark.property
     @given(ledger_entry_pair_strategy())
+    @settings(max_examples=STRUCTURAL_MAX_EXAMPLES, deadline=None)
     def test_modified_ledger_entry_fails_validation(self, entry_pair):
         """
         Property: For ANY ledger entry, modifying it should fail validation.
         """
         debit, _ = entry_pair
 
-        # Create original
-        original = type(debit)(**debit.model_dump())
+        # Create original (dump once, reuse for both copies; the data came from
+        # a validated entry, so model_construct skips revalidation)
+        entry_cls = type(debit)
+        dump = debit.model_dump()
+        original = entry_cls.model_construct(**dump)
 
         # Modify the entry (simulate corruption/tampering)
-        modified = type(debit)(**debit.model_dump())
-        modified.amount = modified.amount + Decimal("100.00")
+        dump["amount"] = dump["amount"] + TAMPER_AMOUNT
+        modified = entry_cls.model_construct(**dump)
 
         # Should fail immutability check
         with pytest.raises(ValidationError, match="amount was modified"):
@@ -63,7 +179,7 @@ class TestLedgerImmutability:
         transaction = TransactionGenerator.create_payment(
             property_id=property.id,
             member_id=property.id,
-            amount=Decimal("300.00"),
+            amount=PAYMENT_AMOUNT,
         )
 
         # Original entry
@@ -77,7 +193,7 @@ class TestLedgerImmutability:
         correction_txn = TransactionGenerator.create(
             property_id=property.id,
             transaction_type=transaction.transaction_type,
-            amount=Decimal("300.00"),
+            amount=PAYMENT_AMOUNT,
         )
 
         debit_reversing, credit_reversing = LedgerEntryGenerator.create_for_payment(
@@ -92,7 +208,7 @@ class TestLedgerImmutability:
 
         # Original should still be unchanged
         assert debit_original.is_reversing is False
-        assert debit_original.amount == Decimal("300.00")
+        assert debit_original.amount == PAYMENT_AMOUNT
 
         # Reversing entry should reference original
         assert debit_reversing.is_reversing is True
@@ -102,42 +218,16 @@ class TestLedgerImmutability:
 class TestAuditTrailCompleteness:
     """Tests for audit trail completeness."""
 
-    def test_all_transactions_have_ledger_entries(self):
+    def test_all_transactions_have_ledger_entries(self, payment_batch):
         """
         Test that all posted transactions have corresponding ledger entries.
 
         This ensures no transactions are "lost" in the audit trail.
         """
-        property = PropertyGenerator.create()
-        fund = PropertyGenerator.create().id  # Mock fund
-
-        # Create 10 transactions
-        transactions = []
-        all_entries = []
-
-        for i in range(10):
-            txn = TransactionGenerator.create_payment(
-                property_id=property.id,
-                member_id=property.id,
-                fund_id=fund,
-                amount=Decimal("300.00"),
-                is_posted=True,
-            )
-            transactions.append(txn)
-
-            # Create ledger entries
-            debit, credit = LedgerEntryGenerator.create_for_payment(
-                property_id=property.id,
-                transaction=txn,
-                fund_id=fund,
-            )
-            all_entries.extend([debit, credit])
-
         # Verify all transactions have entries
-        transaction_ids_with_entries = {entry.transaction_id for entry in all_entries}
-        transaction_ids = {txn.id for txn in transactions}
+        transaction_ids = {txn.id for txn in payment_batch.transactions}
 
-        assert transaction_ids_with_entries == transaction_ids
+        assert payment_batch.entry_transaction_ids == transaction_ids
 
     def test_ledger_entries_maintain_chronological_order(self):
         """
@@ -147,17 +237,15 @@ class TestAuditTrailCompleteness:
         fund = PropertyGenerator.create().id
 
         # Create transactions on different dates
-        from datetime import date, timedelta
-
         entries = []
-        for i in range(5):
-            txn_date = date(2024, 1, 1) + timedelta(days=i * 7)
+        for i in range(PAYMENT_COUNT):
+            txn_date = BASE_DATE + i * WEEK
 
             txn = TransactionGenerator.create_payment(
                 property_id=property.id,
                 member_id=property.id,
                 fund_id=fund,
-                amount=Decimal("300.00"),
+                amount=PAYMENT_AMOUNT,
                 transaction_date=txn_date,
                 is_posted=True,
             )
@@ -172,44 +260,26 @@ class TestAuditTrailCompleteness:
 
         # Verify entries are in chronological order
         entry_dates = [e.entry_date for e in entries]
-        assert entry_dates == sorted(entry_dates)
+        assert _is_monotonic(entry_dates)
 
 
 class TestReconciliation:
     """Tests for account reconciliation."""
 
-    def test_reconcile_balanced_entries(self):
+    def test_reconcile_balanced_entries(self, payment_batch):
         """Test that balanced entries reconcile to correct balance."""
-        property = PropertyGenerator.create()
-        fund = PropertyGenerator.create().id
-
-        # Create 10 payments of $300 each = $3000 net debit (asset increase)
-        all_entries = []
-        for i in range(10):
-            txn = TransactionGenerator.create_payment(
-                property_id=property.id,
-                member_id=property.id,
-                fund_id=fund,
-                amount=Decimal("300.00"),
-            )
-
-            debit, credit = LedgerEntryGenerator.create_for_payment(
-                property_id=property.id,
-                transaction=txn,
-                fund_id=fund,
-            )
-
-            all_entries.extend([debit, credit])
-
+        # AUDIT_BATCH_N payments of $300 each = net debit (asset increase)
         # For cash account (asset): debits increase, credits decrease
         # All cash debits
-        cash_entries = [e for e in all_entries if e.account_code == "1000"]
+        cash_entries = payment_batch.cash_entries
 
         # Expected balance = sum of debits - sum of credits
-        expected_balance = sum(e.debit_amount - e.credit_amount for e in cash_entries)
+        expected_balance = sum(
+            (e.debit_amount for e in cash_entries), ZERO
+        ) - sum((e.credit_amount for e in cash_entries), ZERO)
 
-        # Should be $3000 (10 * $300 debits)
-        assert expected_balance == Decimal("3000.00")
+        # Should be N * $300 debits
+        assert expected_balance == PAYMENT_AMOUNT * AUDIT_BATCH_N
 
         # Reconcile
         assert ReconciliationValidator.reconcile_account_balance(
@@ -223,7 +293,7 @@ class TestReconciliation:
         txn = TransactionGenerator.create_payment(
             property_id=property.id,
             member_id=property.id,
-            amount=Decimal("300.00"),
+            amount=PAYMENT_AMOUNT,
         )
 
         debit, credit = LedgerEntryGenerator.create_for_payment(
@@ -233,10 +303,10 @@ class TestReconciliation:
         )
 
         # Modify to make unbalanced
-        credit.amount = Decimal("250.00")
+        credit.amount = SHORT_AMOUNT
 
         cash_entries = [e for e in [debit, credit] if e.account_code == "1000"]
-        expected_balance = Decimal("300.00")
+        expected_balance = PAYMENT_AMOUNT
 
         # Should fail reconciliation
         with pytest.raises(ValidationError, match="reconciliation failed"):
@@ -245,52 +315,14 @@ class TestReconciliation:
                 expected_balance,
             )
 
-    def test_reconcile_with_refunds(self):
+    def test_reconcile_with_refunds(self, payment_batch, refund_cash_entries):
         """Test reconciliation with both payments and refunds."""
-        property = PropertyGenerator.create()
-        fund = PropertyGenerator.create().id
-
-        all_entries = []
-
-        # 5 payments of $300 = $1500 debit
-        for i in range(5):
-            txn = TransactionGenerator.create_payment(
-                property_id=property.id,
-                member_id=property.id,
-                fund_id=fund,
-                amount=Decimal("300.00"),
-            )
-
-            debit, credit = LedgerEntryGenerator.create_for_payment(
-                property_id=property.id,
-                transaction=txn,
-                fund_id=fund,
-            )
-
-            all_entries.extend([debit, credit])
-
-        # 2 refunds of $150 = $300 credit
-        for i in range(2):
-            txn = TransactionGenerator.create_refund(
-                property_id=property.id,
-                member_id=property.id,
-                fund_id=fund,
-                amount=Decimal("150.00"),
-            )
-
-            debit, credit = LedgerEntryGenerator.create_for_refund(
-                property_id=property.id,
-                transaction=txn,
-                fund_id=fund,
-            )
-
-            all_entries.extend([debit, credit])
-
+        # AUDIT_BATCH_N payments of $300 (debit), REFUND_COUNT refunds of $150 (credit)
         # Cash account balance
-        cash_entries = [e for e in all_entries if e.account_code == "1000"]
+        cash_entries = payment_batch.cash_entries + refund_cash_entries
 
-        # Expected: $1500 (payments) - $300 (refunds) = $1200
-        expected_balance = Decimal("1200.00")
+        # Expected: payments - refunds ($3000 - $300 = $2700 at AUDIT_BATCH_N=10)
+        expected_balance = PAYMENT_AMOUNT * AUDIT_BATCH_N - REFUND_AMOUNT * REFUND_COUNT
 
         assert ReconciliationValidator.reconcile_account_balance(
             cash_entries,
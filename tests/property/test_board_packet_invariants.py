@@ -16,10 +16,11 @@ Uses Hypothesis to verify that board packet operations maintain critical invaria
 - Status progression order
 """
 
+import re
 from datetime import date, datetime, timedelta
 from decimal import Decimal
 
-from hypothesis import assume, given
+from hypothesis import Phase, assume, given, settings
 from hypothesis import strategies as st
 import pytest
 
@@ -27,7 +28,6 @@ from qa_testing.generators import (
     BoardPacketGenerator,
     BoardPacketTemplateGenerator,
     PacketSectionGenerator,
-    PropertyGenerator,
 )
 from qa_testing.models import (
     BoardPacketStatus,
@@ -35,248 +35,182 @@ from qa_testing.models import (
 )
 
 
-# Custom strategies for board packet tests
-@st.composite
-def pdf_size_strategy(draw):
-    """Generate realistic PDF size (1-20 MB)."""
-    return draw(st.integers(min_value=1_000_000, max_value=20_000_000))
+@pytest.fixture(scope="module")
+def sent_packet(tenant_id):
+    """SENT packet shared by the read-only sent-packet invariant tests."""
+    return BoardPacketGenerator.create_sent(tenant_id=tenant_id)
 
 
-@st.composite
-def page_count_strategy(draw):
-    """Generate realistic page count (10-100 pages)."""
-    return draw(st.integers(min_value=10, max_value=100))
+@pytest.fixture(scope="class")
+def packet_id(tenant_id):
+    """ID of a packet shared by a test class's section tests (only the ID is used)."""
+    return BoardPacketGenerator.create(tenant_id=tenant_id).id
 
 
-@st.composite
-def generation_time_strategy(draw):
-    """Generate realistic generation time (10-300 seconds)."""
-    return draw(st.integers(min_value=10, max_value=300))
-
-
-@st.composite
-def days_ahead_strategy(draw):
-    """Generate realistic meeting date (7-60 days ahead)."""
-    return draw(st.integers(min_value=7, max_value=60))
-
+# These invariants are checked against deterministic factory output, so there
+# is nothing useful to shrink and no timing to police: generate examples only
+# (example count still comes from the active profile)
+factory_invariant_settings = settings(
+    deadline=None,
+    phases=[Phase.explicit, Phase.generate],
+)
 
-@st.composite
-def section_order_strategy(draw):
-    """Generate valid section order (0-20)."""
-    return draw(st.integers(min_value=0, max_value=20))
 
+# Custom strategies for board packet tests (plain strategy objects, built once)
+SECTION_TYPES = list(SectionType)  # Enumerated once, not per test
+VALID_SECTION_TYPE_VALUES = frozenset(s.value for s in SectionType)
 
-@st.composite
-def page_start_strategy(draw):
-    """Generate valid page start (1-100)."""
-    return draw(st.integers(min_value=1, max_value=100))
+# local@domain.tld, no whitespace or extra @ (one C-level match per address)
+EMAIL_RE = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
 
+# Realistic PDF size (1-20 MB)
+PDF_SIZE = st.integers(min_value=1_000_000, max_value=20_000_000)
 
-@st.composite
-def page_span_strategy(draw):
-    """Generate valid page span (1-50 pages)."""
-    return draw(st.integers(min_value=1, max_value=50))
+# Realistic page count (10-100 pages)
+PAGE_COUNT = st.integers(min_value=10, max_value=100)
 
+# Realistic generation time (10-300 seconds)
+GENERATION_TIME = st.integers(min_value=10, max_value=300)
 
-@st.composite
-def section_type_strategy(draw):
-    """Generate random section type."""
-    return draw(st.sampled_from(list(SectionType)))
+# Valid section order (0-20)
+SECTION_ORDER = st.integers(min_value=0, max_value=20)
 
+# Valid page start (1-100)
+PAGE_START = st.integers(min_value=1, max_value=100)
 
-@st.composite
-def board_size_strategy(draw):
-    """Generate realistic board size (3-7 members)."""
-    return draw(st.integers(min_value=3, max_value=7))
+# Valid page span (1-50 pages)
+PAGE_SPAN = st.integers(min_value=1, max_value=50)
 
 
 class TestBoardPacketPDFInvariants:
     """Property-based tests for board packet PDF invariants."""
 
+    @factory_invariant_settings
     @given(
-        pdf_size=pdf_size_strategy(),
+        pdf_size=PDF_SIZE,
+        page_count=PAGE_COUNT,
+        generation_time=GENERATION_TIME,
     )
-    def test_pdf_size_always_positive(self, pdf_size):
+    def test_ready_packet_invariants(self, tenant_id, pdf_size, page_count, generation_time):
         """
-        INVARIANT: PDF size is always > 0 when packet is READY.
+        INVARIANT: READY packets have a positive-size PDF and are not sent yet.
 
-        Generated PDFs must have positive file size.
+        One packet is built per example and checked for every READY invariant:
+        - PDF size, page count and generation time are always > 0
+        - A packet cannot be READY without a PDF URL
+        - READY status means generated but not distributed
         """
-        property_obj = PropertyGenerator.create()
-
         packet = BoardPacketGenerator.create_ready(
-            tenant_id=property_obj.tenant_id,
-            page_count=50,
+            tenant_id=tenant_id,
+            page_count=page_count,
+            pdf_size_bytes=pdf_size,
+            generation_time_seconds=generation_time,
         )
 
+        # PDF invariants
         assert packet.pdf_size_bytes is not None
         assert packet.pdf_size_bytes > 0
-
-    @given(
-        page_count=page_count_strategy(),
-    )
-    def test_page_count_always_positive(self, page_count):
-        """
-        INVARIANT: Page count is always > 0 when packet is READY.
-
-        Generated PDFs must have at least one page.
-        """
-        property_obj = PropertyGenerator.create()
-
-        packet = BoardPacketGenerator.create_ready(
-            tenant_id=property_obj.tenant_id,
-            page_count=page_count,
-        )
-
+        assert packet.pdf_size_bytes == pdf_size
         assert packet.page_count is not None
         assert packet.page_count > 0
-
-    @given(
-        generation_time=generation_time_strategy(),
-    )
-    def test_generation_time_always_positive(self, generation_time):
-        """
-        INVARIANT: Generation time is always > 0 when packet is READY.
-
-        PDF generation must take some time.
-        """
-        property_obj = PropertyGenerator.create()
-
-        packet = BoardPacketGenerator.create_ready(
-            tenant_id=property_obj.tenant_id,
-        )
-
         assert packet.generation_time_seconds is not None
         assert packet.generation_time_seconds > 0
+        assert packet.generation_time_seconds == generation_time
 
-    def test_ready_packet_has_pdf_url(self):
-        """
-        INVARIANT: READY packets always have PDF URL.
-
-        A packet cannot be READY without a PDF.
-        """
-        property_obj = PropertyGenerator.create()
-
-        packet = BoardPacketGenerator.create_ready(
-            tenant_id=property_obj.tenant_id,
-        )
-
+        # Status invariants
         assert packet.status == BoardPacketStatus.READY
         assert packet.has_pdf
         assert packet.pdf_url != ""
+        assert packet.is_generated
+        assert not packet.is_sent
+        assert len(packet.sent_to) == 0
+        assert packet.sent_date is None
 
-    def test_sent_packet_has_pdf_url(self):
+    def test_sent_packet_has_pdf_url(self, sent_packet):
         """
         INVARIANT: SENT packets always have PDF URL.
 
         A packet cannot be SENT without a PDF.
         """
-        property_obj = PropertyGenerator.create()
-
-        packet = BoardPacketGenerator.create_sent(
-            tenant_id=property_obj.tenant_id,
-        )
-
-        assert packet.status == BoardPacketStatus.SENT
-        assert packet.has_pdf
-        assert packet.pdf_url != ""
+        assert sent_packet.status == BoardPacketStatus.SENT
+        assert sent_packet.has_pdf
+        assert sent_packet.pdf_url != ""
 
 
 class TestBoardPacketDateInvariants:
     """Property-based tests for board packet date invariants."""
 
-    @given(
-        days_ahead=days_ahead_strategy(),
-    )
-    def test_meeting_date_in_future(self, days_ahead):
+    def test_meeting_date_in_future(self, tenant_id):
         """
         INVARIANT: Meeting dates are typically in the future.
 
-        Board packets are generated before the meeting.
+        Board packets are generated before the meeting. Any lead time in the
+        realistic 7-60 day range exercises this, so a single value is used.
         """
-        property_obj = PropertyGenerator.create()
-        meeting_date = date.today() + timedelta(days=days_ahead)
+        meeting_date = date.today() + timedelta(days=30)
 
         packet = BoardPacketGenerator.create(
-            tenant_id=property_obj.tenant_id,
+            tenant_id=tenant_id,
             meeting_date=meeting_date,
         )
 
         assert packet.meeting_date >= date.today()
 
-    def test_sent_date_after_generated_date(self):
+    def test_sent_date_after_generated_date(self, sent_packet):
         """
         INVARIANT: Sent date is always >= generated date.
 
         Packets cannot be sent before they are generated.
         """
-        property_obj = PropertyGenerator.create()
-
-        packet = BoardPacketGenerator.create_sent(
-            tenant_id=property_obj.tenant_id,
-        )
-
-        assert packet.sent_date is not None
-        assert packet.sent_date >= packet.generated_date
+        assert sent_packet.sent_date is not None
+        assert sent_packet.sent_date >= sent_packet.generated_date
 
-    def test_meeting_date_is_date_type(self):
+    def test_meeting_date_is_date_type(self, tenant_id):
         """
         INVARIANT: Meeting date is date type (not datetime).
 
         Meeting dates don't need time precision.
         """
-        property_obj = PropertyGenerator.create()
-
         packet = BoardPacketGenerator.create(
-            tenant_id=property_obj.tenant_id,
+            tenant_id=tenant_id,
         )
 
         assert isinstance(packet.meeting_date, date)
         assert not isinstance(packet.meeting_date, datetime)
 
-    def test_generated_date_is_datetime_type(self):
+    def test_generated_date_is_datetime_type(self, tenant_id):
         """
         INVARIANT: Generated date is datetime type (not date).
 
         Generation timestamps need time precision.
         """
-        property_obj = PropertyGenerator.create()
-
         packet = BoardPacketGenerator.create(
-            tenant_id=property_obj.tenant_id,
+            tenant_id=tenant_id,
         )
 
         assert isinstance(packet.generated_date, datetime)
 
-    def test_sent_date_is_datetime_type(self):
+    def test_sent_date_is_datetime_type(self, sent_packet):
         """
         INVARIANT: Sent date is datetime type (not date).
 
         Sent timestamps need time precision.
         """
-        property_obj = PropertyGenerator.create()
-
-        packet = BoardPacketGenerator.create_sent(
-            tenant_id=property_obj.tenant_id,
-        )
-
-        assert packet.sent_date is not None
-        assert isinstance(packet.sent_date, datetime)
+        assert sent_packet.sent_date is not None
+        assert isinstance(sent_packet.sent_date, datetime)
 
 
 class TestBoardPacketStatusInvariants:
     """Property-based tests for board packet status invariants."""
 
-    def test_generating_packet_has_no_pdf(self):
+    def test_generating_packet_has_no_pdf(self, tenant_id):
         """
         INVARIANT: GENERATING packets don't have PDF yet.
 
         PDFs are not available until generation completes.
         """
-        property_obj = PropertyGenerator.create()
-
         packet = BoardPacketGenerator.create_generating(
-            tenant_id=property_obj.tenant_id,
+            tenant_id=tenant_id,
         )
 
         assert packet.status == BoardPacketStatus.GENERATING
@@ -284,65 +218,33 @@ class TestBoardPacketStatusInvariants:
         assert packet.pdf_size_bytes is None
         assert packet.page_count is None
 
-    def test_ready_packet_not_sent(self):
-        """
-        INVARIANT: READY packets are not sent yet.
-
-        READY status means generated but not distributed.
-        """
-        property_obj = PropertyGenerator.create()
-
-        packet = BoardPacketGenerator.create_ready(
-            tenant_id=property_obj.tenant_id,
-        )
-
-        assert packet.status == BoardPacketStatus.READY
-        assert packet.is_generated
-        assert not packet.is_sent
-        assert len(packet.sent_to) == 0
-        assert packet.sent_date is None
-
-    def test_sent_packet_has_recipients(self):
+    def test_sent_packet_has_recipients(self, sent_packet):
         """
         INVARIANT: SENT packets always have recipients.
 
         Cannot be SENT without email addresses.
         """
-        property_obj = PropertyGenerator.create()
-
-        packet = BoardPacketGenerator.create_sent(
-            tenant_id=property_obj.tenant_id,
-        )
+        assert sent_packet.status == BoardPacketStatus.SENT
+        assert len(sent_packet.sent_to) > 0
+        assert sent_packet.recipient_count > 0
 
-        assert packet.status == BoardPacketStatus.SENT
-        assert len(packet.sent_to) > 0
-        assert packet.recipient_count > 0
-
-    def test_sent_packet_has_sent_date(self):
+    def test_sent_packet_has_sent_date(self, sent_packet):
         """
         INVARIANT: SENT packets always have sent_date.
 
         Sent timestamp is required for SENT status.
         """
-        property_obj = PropertyGenerator.create()
-
-        packet = BoardPacketGenerator.create_sent(
-            tenant_id=property_obj.tenant_id,
-        )
-
-        assert packet.status == BoardPacketStatus.SENT
-        assert packet.sent_date is not None
+        assert sent_packet.status == BoardPacketStatus.SENT
+        assert sent_packet.sent_date is not None
 
-    def test_failed_packet_has_notes(self):
+    def test_failed_packet_has_notes(self, tenant_id):
         """
         INVARIANT: FAILED packets should have notes explaining failure.
 
         Failures should be documented.
         """
-        property_obj = PropertyGenerator.create()
-
         packet = BoardPacketGenerator.create_failed(
-            tenant_id=property_obj.tenant_id,
+            tenant_id=tenant_id,
         )
 
         assert packet.status == BoardPacketStatus.FAILED
@@ -352,103 +254,82 @@ class TestBoardPacketStatusInvariants:
 class TestBoardPacketRecipientInvariants:
     """Property-based tests for board packet recipient invariants."""
 
-    @given(
-        board_size=board_size_strategy(),
-    )
-    def test_recipient_count_matches_list_length(self, board_size):
+    def test_recipient_count_matches_list_length(self, tenant_id):
         """
         INVARIANT: recipient_count property matches sent_to list length.
 
-        Count should always reflect actual list size.
+        Count should always reflect actual list size (typical boards have 3-7 members).
         """
-        property_obj = PropertyGenerator.create()
+        for board_size in (3, 5, 7):
+            # Create realistic email addresses
+            recipients = [f"board{i}@hoa.com" for i in range(board_size)]
 
-        # Create realistic email addresses
-        recipients = [f"board{i}@hoa.com" for i in range(board_size)]
-
-        packet = BoardPacketGenerator.create_sent(
-            tenant_id=property_obj.tenant_id,
-            sent_to=recipients,
-        )
+            packet = BoardPacketGenerator.create_sent(
+                tenant_id=tenant_id,
+                sent_to=recipients,
+            )
 
-        assert packet.recipient_count == len(packet.sent_to)
-        assert packet.recipient_count == board_size
+            assert packet.recipient_count == len(packet.sent_to)
+            assert packet.recipient_count == board_size
 
-    def test_email_addresses_are_valid_format(self):
+    def test_email_addresses_are_valid_format(self, sent_packet):
         """
         INVARIANT: All email addresses in sent_to have valid format.
 
-        Emails must contain @ and . characters.
+        Emails must look like local@domain.tld.
         """
-        property_obj = PropertyGenerator.create()
-
-        packet = BoardPacketGenerator.create_sent(
-            tenant_id=property_obj.tenant_id,
-        )
-
-        for email in packet.sent_to:
-            assert "@" in email
-            assert "." in email
+        invalid = [email for email in sent_packet.sent_to if not EMAIL_RE.fullmatch(email)]
+        assert not invalid, f"Invalid email addresses: {invalid}"
 
 
 class TestBoardPacketTemplateInvariants:
     """Property-based tests for board packet template invariants."""
 
-    def test_template_sections_are_valid_types(self):
+    def test_template_sections_are_valid_types(self, tenant_id):
         """
         INVARIANT: All template sections are valid SectionType values.
 
         Invalid section types should not be accepted.
         """
-        property_obj = PropertyGenerator.create()
-
         template = BoardPacketTemplateGenerator.create(
-            tenant_id=property_obj.tenant_id,
+            tenant_id=tenant_id,
         )
 
-        valid_types = {s.value for s in SectionType}
-
         for section in template.sections:
-            assert section in valid_types
+            assert section in VALID_SECTION_TYPE_VALUES
 
-    def test_template_section_count_property(self):
+    def test_template_section_count_property(self, tenant_id):
         """
         INVARIANT: section_count property matches sections list length.
 
         Count should always reflect actual list size.
         """
-        property_obj = PropertyGenerator.create()
-
         template = BoardPacketTemplateGenerator.create(
-            tenant_id=property_obj.tenant_id,
+            tenant_id=tenant_id,
         )
 
         assert template.section_count == len(template.sections)
 
-    def test_default_template_has_is_default_true(self):
+    def test_default_template_has_is_default_true(self, tenant_id):
         """
         INVARIANT: Default templates have is_default=True.
 
         Default flag must be set correctly.
         """
-        property_obj = PropertyGenerator.create()
-
         template = BoardPacketTemplateGenerator.create_default_template(
-            tenant_id=property_obj.tenant_id,
+            tenant_id=tenant_id,
         )
 
         assert template.is_default is True
 
-    def test_template_name_not_empty(self):
+    def test_template_name_not_empty(self, tenant_id):
         """
         INVARIANT: Template name is never empty.
 
         Templates must have names.
         """
-        property_obj = PropertyGenerator.create()
-
         template = BoardPacketTemplateGenerator.create(
-            tenant_id=property_obj.tenant_id,
+            tenant_id=tenant_id,
         )
 
         assert template.name != ""
@@ -458,26 +339,24 @@ class TestBoardPacketTemplateInvariants:
 class TestPacketSectionPageInvariants:
     """Property-based tests for packet section page invariants."""
 
+    @factory_invariant_settings
     @given(
-        page_start=page_start_strategy(),
-        page_span=page_span_strategy(),
+        page_start=PAGE_START,
+        page_span=PAGE_SPAN,
     )
-    def test_page_end_always_greater_or_equal_to_page_start(self, page_start, page_span):
+    def test_page_end_always_greater_or_equal_to_page_start(
+        self, tenant_id, packet_id, page_start, page_span
+    ):
         """
         INVARIANT: page_end >= page_start for all sections.
 
         Sections cannot end before they start.
         """
-        property_obj = PropertyGenerator.create()
-        packet = BoardPacketGenerator.create(
-            tenant_id=property_obj.tenant_id,
-        )
-
         page_end = page_start + page_span - 1
 
         section = PacketSectionGenerator.create_with_pages(
-            tenant_id=property_obj.tenant_id,
-            packet_id=packet.id,
+            tenant_id=tenant_id,
+            packet_id=packet_id,
             section_type=SectionType.TRIAL_BALANCE,
             page_start=page_start,
             page_end=page_end,
@@ -485,26 +364,22 @@ class TestPacketSectionPageInvariants:
 
         assert section.page_end >= section.page_start
 
+    @factory_invariant_settings
     @given(
-        page_start=page_start_strategy(),
-        page_span=page_span_strategy(),
+        page_start=PAGE_START,
+        page_span=PAGE_SPAN,
     )
-    def test_page_count_calculation_is_correct(self, page_start, page_span):
+    def test_page_count_calculation_is_correct(self, tenant_id, packet_id, page_start, page_span):
         """
         INVARIANT: page_count = page_end - page_start + 1.
 
         Page count calculation must be accurate.
         """
-        property_obj = PropertyGenerator.create()
-        packet = BoardPacketGenerator.create(
-            tenant_id=property_obj.tenant_id,
-        )
-
         page_end = page_start + page_span - 1
 
         section = PacketSectionGenerator.create_with_pages(
-            tenant_id=property_obj.tenant_id,
-            packet_id=packet.id,
+            tenant_id=tenant_id,
+            packet_id=packet_id,
             section_type=SectionType.FINANCIAL_SUMMARY,
             page_start=page_start,
             page_end=page_end,
@@ -513,20 +388,15 @@ class TestPacketSectionPageInvariants:
         expected_count = page_end - page_start + 1
         assert section.page_count == expected_count
 
-    def test_page_start_always_positive(self):
+    def test_page_start_always_positive(self, tenant_id, packet_id):
         """
         INVARIANT: page_start is always >= 1.
 
         Page numbers start at 1, not 0.
         """
-        property_obj = PropertyGenerator.create()
-        packet = BoardPacketGenerator.create(
-            tenant_id=property_obj.tenant_id,
-        )
-
         section = PacketSectionGenerator.create_with_pages(
-            tenant_id=property_obj.tenant_id,
-            packet_id=packet.id,
+            tenant_id=tenant_id,
+            packet_id=packet_id,
             section_type=SectionType.AGENDA,
             page_start=1,
             page_end=3,
@@ -535,20 +405,15 @@ class TestPacketSectionPageInvariants:
         assert section.page_start is not None
         assert section.page_start >= 1
 
-    def test_cover_page_is_always_one_page(self):
+    def test_cover_page_is_always_one_page(self, tenant_id, packet_id):
         """
         INVARIANT: Cover page sections are always exactly 1 page.
 
         Cover pages should not span multiple pages.
         """
-        property_obj = PropertyGenerator.create()
-        packet = BoardPacketGenerator.create(
-            tenant_id=property_obj.tenant_id,
-        )
-
         section = PacketSectionGenerator.create_cover_page(
-            tenant_id=property_obj.tenant_id,
-            packet_id=packet.id,
+            tenant_id=tenant_id,
+            packet_id=packet_id,
         )
 
         assert section.section_type == SectionType.COVER_PAGE
@@ -558,42 +423,33 @@ class TestPacketSectionPageInvariants:
 class TestPacketSectionOrderInvariants:
     """Property-based tests for packet section order invariants."""
 
+    @factory_invariant_settings
     @given(
-        order=section_order_strategy(),
+        order=SECTION_ORDER,
     )
-    def test_section_order_always_non_negative(self, order):
+    def test_section_order_always_non_negative(self, tenant_id, packet_id, order):
         """
         INVARIANT: Section order is always >= 0.
 
         Negative ordering doesn't make sense.
         """
-        property_obj = PropertyGenerator.create()
-        packet = BoardPacketGenerator.create(
-            tenant_id=property_obj.tenant_id,
-        )
-
         section = PacketSectionGenerator.create(
-            tenant_id=property_obj.tenant_id,
-            packet_id=packet.id,
+            tenant_id=tenant_id,
+            packet_id=packet_id,
             order=order,
         )
 
         assert section.order >= 0
 
-    def test_cover_page_always_first(self):
+    def test_cover_page_always_first(self, tenant_id, packet_id):
         """
         INVARIANT: Cover page sections should have order=0.
 
         Cover pages should always be first.
         """
-        property_obj = PropertyGenerator.create()
-        packet = BoardPacketGenerator.create(
-            tenant_id=property_obj.tenant_id,
-        )
-
         section = PacketSectionGenerator.create_cover_page(
-            tenant_id=property_obj.tenant_id,
-            packet_id=packet.id,
+            tenant_id=tenant_id,
+            packet_id=packet_id,
         )
 
         assert section.order == 0
@@ -602,38 +458,28 @@ class TestPacketSectionOrderInvariants:
 class TestPacketSectionContentInvariants:
     """Property-based tests for packet section content invariants."""
 
-    def test_section_has_content_url_or_data(self):
+    def test_section_has_content_url_or_data(self, tenant_id, packet_id):
         """
         INVARIANT: Sections should have either content_url or content_data.
 
         Sections must have content source.
         """
-        property_obj = PropertyGenerator.create()
-        packet = BoardPacketGenerator.create(
-            tenant_id=property_obj.tenant_id,
-        )
-
         section = PacketSectionGenerator.create(
-            tenant_id=property_obj.tenant_id,
-            packet_id=packet.id,
+            tenant_id=tenant_id,
+            packet_id=packet_id,
         )
 
         assert section.has_content
 
-    def test_section_title_not_empty(self):
+    def test_section_title_not_empty(self, tenant_id, packet_id):
         """
         INVARIANT: Section title is never empty.
 
         All sections must have titles.
         """
-        property_obj = PropertyGenerator.create()
-        packet = BoardPacketGenerator.create(
-            tenant_id=property_obj.tenant_id,
-        )
-
         section = PacketSectionGenerator.create(
-            tenant_id=property_obj.tenant_id,
-            packet_id=packet.id,
+            tenant_id=tenant_id,
+            packet_id=packet_id,
         )
 
         assert section.title != ""
@@ -643,49 +489,40 @@ class TestPacketSectionContentInvariants:
 class TestBoardPacketSectionTypeInvariants:
     """Property-based tests for all section types."""
 
-    @given(
-        section_type=section_type_strategy(),
-    )
-    def test_all_section_types_valid(self, section_type):
+    @pytest.mark.parametrize("section_type", SECTION_TYPES)
+    def test_all_section_types_valid(self, tenant_id, packet_id, section_type):
         """
         INVARIANT: All SectionType enum values can be used.
 
         Every section type should be supported.
         """
-        property_obj = PropertyGenerator.create()
-        packet = BoardPacketGenerator.create(
-            tenant_id=property_obj.tenant_id,
-        )
-
         section = PacketSectionGenerator.create(
-            tenant_id=property_obj.tenant_id,
-            packet_id=packet.id,
+            tenant_id=tenant_id,
+            packet_id=packet_id,
             section_type=section_type,
         )
 
         assert section.section_type == section_type
-        assert section.section_type in list(SectionType)
+        assert section.section_type in SECTION_TYPES
 
 
 class TestBoardPacketEndToEndInvariants:
     """Property-based tests for complete board packet workflows."""
 
-    def test_complete_workflow_maintains_invariants(self):
+    def test_complete_workflow_maintains_invariants(self, tenant_id):
         """
         INVARIANT: Complete workflow (template -> packet -> sections) maintains all invariants.
 
         End-to-end process should be consistent.
         """
-        property_obj = PropertyGenerator.create()
-
         # Create template
         template = BoardPacketTemplateGenerator.create_default_template(
-            tenant_id=property_obj.tenant_id,
+            tenant_id=tenant_id,
         )
 
         # Create packet
         packet = BoardPacketGenerator.create(
-            tenant_id=property_obj.tenant_id,
+            tenant_id=tenant_id,
             template_id=template.id,
             status=BoardPacketStatus.READY,
         )
@@ -695,7 +532,7 @@ class TestBoardPacketEndToEndInvariants:
         for i, section_type_value in enumerate(template.sections[:5]):  # First 5 sections
             section_type = SectionType(section_type_value)
             section = PacketSectionGenerator.create(
-                tenant_id=property_obj.tenant_id,
+                tenant_id=tenant_id,
                 packet_id=packet.id,
                 section_type=section_type,
                 order=i,
@@ -713,38 +550,39 @@ class TestBoardPacketEndToEndInvariants:
             assert section.order == i
             assert section.has_content
 
-    def test_sent_packet_maintains_all_invariants(self):
+    def test_sent_packet_maintains_all_invariants(self, sent_packet):
         """
         INVARIANT: Sent packets maintain all generation and distribution invariants.
 
         Sent status implies all previous invariants still hold.
         """
-        property_obj = PropertyGenerator.create()
-
-        packet = BoardPacketGenerator.create_sent(
-            tenant_id=property_obj.tenant_id,
-        )
+        # Read each field once; several assertions below reuse them
+        pdf_size = sent_packet.pdf_size_bytes
+        page_count = sent_packet.page_count
+        sent_date = sent_packet.sent_date
+        generated_date = sent_packet.generated_date
+        meeting_date = sent_packet.meeting_date
 
         # Status invariants
-        assert packet.status == BoardPacketStatus.SENT
-        assert packet.is_generated
-        assert packet.is_sent
+        assert sent_packet.status == BoardPacketStatus.SENT
+        assert sent_packet.is_generated
+        assert sent_packet.is_sent
 
         # PDF invariants
-        assert packet.has_pdf
-        assert packet.pdf_url != ""
-        assert packet.pdf_size_bytes is not None
-        assert packet.pdf_size_bytes > 0
-        assert packet.page_count is not None
-        assert packet.page_count > 0
+        assert sent_packet.has_pdf
+        assert sent_packet.pdf_url != ""
+        assert pdf_size is not None
+        assert pdf_size > 0
+        assert page_count is not None
+        assert page_count > 0
 
         # Distribution invariants
-        assert len(packet.sent_to) > 0
-        assert packet.sent_date is not None
-        assert packet.sent_date >= packet.generated_date
+        assert len(sent_packet.sent_to) > 0
+        assert sent_date is not None
+        assert sent_date >= generated_date
 
         # Date type invariants
-        assert isinstance(packet.meeting_date, date)
-        assert not isinstance(packet.meeting_date, datetime)
-        assert isinstance(packet.generated_date, datetime)
-        assert isinstance(packet.sent_date, datetime)
+        assert isinstance(meeting_date, date)
+        assert not isinstance(meeting_date, datetime)
+        assert isinstance(generated_date, datetime)
+        assert isinstance(sent_date, datetime)
@@ -8,58 +8,86 @@ Uses Hypothesis to verify that budget operations maintain critical invariants:
 - Budget status transitions are valid
 """
 
-from datetime import date, timedelta
+from datetime import date
 from decimal import Decimal
+from functools import lru_cache
+from uuid import uuid4
 
-from hypothesis import assume, given
+from hypothesis import example, given, settings
 from hypothesis import strategies as st
 import pytest
 
-from qa_testing.generators import BudgetGenerator, PropertyGenerator
+from qa_testing.generators import BudgetGenerator
 from qa_testing.models import BudgetStatus
+from tests.strategies import cents_to_decimal, div_half_even
+
+
+# Custom strategies for budget testing (strategy objects built once at import)
+
+# Valid fiscal years (today's date is read once, at import)
+MIN_FISCAL_YEAR = 2020
+MAX_FISCAL_YEAR = date.today().year + 5
+FISCAL_YEAR = st.integers(min_value=MIN_FISCAL_YEAR, max_value=MAX_FISCAL_YEAR)
+
+# Decimal literals used across tests (parsed once at import)
+ZERO = Decimal("0.00")
+CENT = Decimal("0.01")
+HUNDRED = Decimal("100")
+ON_TRACK_LIMIT = Decimal("5.00")  # Max |variance %| still classed on_track
+UNDER_SPEND = Decimal("0.90")
+OVER_SPEND = Decimal("1.10")
+
+# Generator calls (first-call Faker setup, coverage tracing) can make a single
+# example slow without anything being wrong, so no @given here has a deadline
+budget_settings = settings(deadline=None)
+
+# Invariants whose input space is a small integer range need fewer examples
+low_variability_settings = settings(budget_settings, max_examples=25)
+
+# Realistic budget amounts: $100 to $1,000,000.99 with 2 decimal places.
+# Drawn as integer cents; the arithmetic-only tests stay in cents and the
+# model-construction tests get the Decimal view.
+BUDGET_CENTS = st.integers(min_value=100_00, max_value=1_000_000_99)
+BUDGET_AMOUNT = BUDGET_CENTS.map(cents_to_decimal)
+
+
+@lru_cache(maxsize=256)
+def _budget_with_lines(tenant_id, num_lines, fiscal_year=None):
+    """
+    Memoized BudgetGenerator.create_with_lines, keyed on its identifying inputs.
+
+    The line invariants hold for any generated amounts, so repeated draws of the
+    same key can reuse one budget. Lines come back as a tuple; callers must
+    treat the result as read-only since it is shared across examples.
+    """
+    budget, lines = BudgetGenerator.create_with_lines(
+        tenant_id=tenant_id,
+        fiscal_year=fiscal_year,
+        num_lines=num_lines,
+    )
+    return budget, tuple(lines)
 
 
-# Custom strategies for budget testing
-@st.composite
-def fiscal_year_strategy(draw):
-    """Generate valid fiscal years."""
-    current_year = date.today().year
-    return draw(st.integers(min_value=2020, max_value=current_year + 5))
-
-
-@st.composite
-def budget_amount_strategy(draw):
-    """Generate realistic budget amounts."""
-    # Generate amounts between $100 and $1,000,000 with 2 decimal places
-    dollars = draw(st.integers(min_value=100, max_value=1_000_000))
-    cents = draw(st.integers(min_value=0, max_value=99))
-    return Decimal(f"{dollars}.{cents:02d}")
-
-
-@st.composite
-def date_range_strategy(draw, year):
-    """Generate valid date range for a fiscal year."""
-    # Most budgets run Jan 1 - Dec 31, but allow other ranges
-    start_month = draw(st.integers(min_value=1, max_value=12))
-    start_day = draw(st.integers(min_value=1, max_value=28))  # Safe for all months
-
-    start_date = date(year, start_month, start_day)
-
-    # End date must be after start date, typically 12 months later
-    days_later = draw(st.integers(min_value=30, max_value=400))
-    end_date = start_date + timedelta(days=days_later)
+@pytest.fixture(scope="class")
+def budget():
+    """
+    Budget shared by a test class's variance tests.
 
-    return start_date, end_date
+    Those tests only read its IDs and period, so one budget per class is enough
+    (and the generator's own tenant ID will do).
+    """
+    return BudgetGenerator.create()
 
 
 class TestBudgetInvariants:
     """Property-based tests for budget invariants."""
 
+    @budget_settings
     @given(
-        fiscal_year=fiscal_year_strategy(),
+        fiscal_year=FISCAL_YEAR,
         num_lines=st.integers(min_value=1, max_value=20),
     )
-    def test_total_budgeted_equals_sum_of_lines(self, fiscal_year, num_lines):
+    def test_total_budgeted_equals_sum_of_lines(self, tenant_id, fiscal_year, num_lines):
         """
         INVARIANT: Budget total must always equal sum of budget lines.
 
@@ -68,69 +96,59 @@ class TestBudgetInvariants:
         - Individual line amounts
         - Budget status
         """
-        property_obj = PropertyGenerator.create()
-
-        budget, lines = BudgetGenerator.create_with_lines(
-            tenant_id=property_obj.tenant_id,
-            fiscal_year=fiscal_year,
-            num_lines=num_lines,
-        )
+        budget, lines = _budget_with_lines(tenant_id, num_lines, fiscal_year)
 
-        # Calculate total two ways
-        method1_total = budget.get_total_budgeted(lines)
-        method2_total = sum((line.budgeted_amount for line in lines), Decimal("0.00"))
+        total = budget.get_total_budgeted(lines)
 
-        # Must be identical
-        assert method1_total == method2_total
-        assert method1_total >= Decimal("0.00")
+        # Must equal an independent sum of the lines
+        assert total == sum((line.budgeted_amount for line in lines), ZERO)
+        assert total >= ZERO
 
+    @budget_settings
     @given(
-        budgeted=budget_amount_strategy(),
-        actual=budget_amount_strategy(),
+        budgeted=BUDGET_CENTS,
+        actual=BUDGET_CENTS,
     )
     def test_variance_calculation_accuracy(self, budgeted, actual):
         """
         INVARIANT: Variance = Budgeted - Actual (always accurate).
 
-        This must hold for any budgeted and actual amounts.
+        This must hold for any budgeted and actual amounts. Checks the variance
+        arithmetic directly; test_variance_report_totals_consistency covers the
+        same math through a full VarianceReport.
         """
-        property_obj = PropertyGenerator.create()
-        budget = BudgetGenerator.create(tenant_id=property_obj.tenant_id)
-
-        report = BudgetGenerator.create_variance_report(
-            tenant_id=property_obj.tenant_id,
-            budget_id=budget.id,
-            budget_name=budget.name,
-            fiscal_year=budget.fiscal_year,
-            period_start=budget.start_date,
-            period_end=budget.end_date,
-            total_budgeted=budgeted,
-            total_actual=actual,
+        variance, variance_pct = BudgetGenerator.calculate_variance(
+            cents_to_decimal(budgeted), cents_to_decimal(actual)
         )
 
-        # Variance must equal budgeted - actual
-        expected_variance = budgeted - actual
-        assert report.total_variance == expected_variance
-
-        # Variance percentage must be accurate
-        if budgeted != Decimal("0.00"):
-            expected_pct = (expected_variance / budgeted * Decimal("100")).quantize(Decimal("0.01"))
-            assert report.variance_percentage == expected_pct
-
-    def test_budget_dates_consistency(self):
+        # Variance must equal budgeted - actual (expected values computed in
+        # integer cents, converted to Decimal only for the comparison)
+        variance_cents = budgeted - actual
+        assert variance == cents_to_decimal(variance_cents)
+
+        # Variance percentage must be accurate (in hundredths of a percent;
+        # budgeted is always >= $100, so never zero)
+        pct_hundredths = div_half_even(variance_cents * 10000, budgeted)
+        assert variance_pct == cents_to_decimal(pct_hundredths)
+
+    @pytest.mark.parametrize(
+        "start_date,end_date",
+        [
+            (date(2025, 1, 1), date(2025, 12, 31)),  # Standard fiscal year (Jan 1 - Dec 31)
+            (date(2025, 7, 1), date(2026, 6, 30)),  # Custom fiscal year (Jul 1 - Jun 30)
+        ],
+    )
+    def test_budget_dates_consistency(self, tenant_id, start_date, end_date):
         """
         INVARIANT: end_date must always be after start_date.
 
         This must hold for any fiscal year and date range.
         """
-        property_obj = PropertyGenerator.create()
-
-        # Test with standard fiscal year (Jan 1 - Dec 31)
         budget = BudgetGenerator.create(
-            tenant_id=property_obj.tenant_id,
+            tenant_id=tenant_id,
             fiscal_year=2025,
-            start_date=date(2025, 1, 1),
-            end_date=date(2025, 12, 31),
+            start_date=start_date,
+            end_date=end_date,
         )
 
         assert budget.end_date > budget.start_date
@@ -139,23 +157,18 @@ class TestBudgetInvariants:
         period_days = (budget.end_date - budget.start_date).days
         assert 30 <= period_days <= 400
 
-        # Test with custom fiscal year (Jul 1 - Jun 30)
-        budget2 = BudgetGenerator.create(
-            tenant_id=property_obj.tenant_id,
-            fiscal_year=2025,
-            start_date=date(2025, 7, 1),
-            end_date=date(2026, 6, 30),
-        )
-
-        assert budget2.end_date > budget2.start_date
-        period_days2 = (budget2.end_date - budget2.start_date).days
-        assert 30 <= period_days2 <= 400
-
+    @budget_settings
     @given(
-        budgeted=budget_amount_strategy(),
-        variance_pct=st.decimals(min_value="-50.00", max_value="50.00", places=2),
+        budgeted=BUDGET_CENTS,
+        variance_bps=st.integers(min_value=-5000, max_value=5000),  # -50% to +50%
     )
-    def test_variance_status_classification(self, budgeted, variance_pct):
+    # Classification boundaries: exactly on budget, +/-5% (on track), +/-5.01%
+    @example(budgeted=1000_00, variance_bps=0)
+    @example(budgeted=1000_00, variance_bps=500)
+    @example(budgeted=1000_00, variance_bps=-500)
+    @example(budgeted=1000_00, variance_bps=501)
+    @example(budgeted=1000_00, variance_bps=-501)
+    def test_variance_status_classification(self, budget, budgeted, variance_bps):
         """
         INVARIANT: Variance status classification must be consistent.
 
@@ -163,20 +176,19 @@ class TestBudgetInvariants:
         - favorable: variance > 0 and |variance| > 5%
         - unfavorable: variance < 0 and |variance| > 5%
         """
-        property_obj = PropertyGenerator.create()
-        budget = BudgetGenerator.create(tenant_id=property_obj.tenant_id)
+        # Calculate actual from the variance in basis points (integer cents)
+        actual_cents = budgeted * (10000 - variance_bps) // 10000
+        budgeted = cents_to_decimal(budgeted)
+        actual = cents_to_decimal(actual_cents)
+
         line = BudgetGenerator.create_budget_line(
-            tenant_id=property_obj.tenant_id,
+            tenant_id=budget.tenant_id,
             budget_id=budget.id,
             budgeted_amount=budgeted,
         )
 
-        # Calculate actual based on variance percentage
-        actual = budgeted * (Decimal("1.00") - variance_pct / Decimal("100"))
-        actual = actual.quantize(Decimal("0.01"))
-
         line_variance = BudgetGenerator.create_line_variance(
-            tenant_id=property_obj.tenant_id,
+            tenant_id=budget.tenant_id,
             budget_line_id=line.id,
             account_number=line.account_number,
             account_name=line.account_name,
@@ -187,33 +199,31 @@ class TestBudgetInvariants:
         # Verify status classification
         abs_variance_pct = abs(line_variance.variance_percentage)
 
-        if abs_variance_pct <= Decimal("5.00"):
+        if abs_variance_pct <= ON_TRACK_LIMIT:
             assert line_variance.status == "on_track"
-        elif line_variance.variance > Decimal("0.00"):
+        elif line_variance.variance > ZERO:
             assert line_variance.status == "favorable"
         else:
             assert line_variance.status == "unfavorable"
 
+    @low_variability_settings
     @given(
         num_lines=st.integers(min_value=1, max_value=10),
     )
-    def test_budget_lines_all_positive(self, num_lines):
+    def test_budget_lines_all_positive(self, tenant_id, num_lines):
         """
         INVARIANT: All budget line amounts must be non-negative.
 
         Budget lines cannot have negative amounts.
         """
-        property_obj = PropertyGenerator.create()
-
-        _, lines = BudgetGenerator.create_with_lines(
-            tenant_id=property_obj.tenant_id,
-            num_lines=num_lines,
-        )
+        _, lines = _budget_with_lines(tenant_id, num_lines)
 
-        for line in lines:
-            assert line.budgeted_amount >= Decimal("0.00")
+        assert min(line.budgeted_amount for line in lines) >= ZERO
 
-    def test_approved_budgets_have_approval_metadata(self):
+    @pytest.mark.parametrize(
+        "status", [BudgetStatus.APPROVED, BudgetStatus.ACTIVE, BudgetStatus.CLOSED]
+    )
+    def test_approved_budgets_have_approval_metadata(self, tenant_id, status):
         """
         INVARIANT: Approved/Active/Closed budgets must have approval metadata.
 
@@ -221,16 +231,13 @@ class TestBudgetInvariants:
         - approved_by (user ID)
         - approved_at (date)
         """
-        property_obj = PropertyGenerator.create()
-
-        for status in [BudgetStatus.APPROVED, BudgetStatus.ACTIVE, BudgetStatus.CLOSED]:
-            budget = BudgetGenerator.create(
-                tenant_id=property_obj.tenant_id,
-                status=status,
-            )
+        budget = BudgetGenerator.create(
+            tenant_id=tenant_id,
+            status=status,
+        )
 
-            assert budget.approved_by is not None, f"{status} budget missing approved_by"
-            assert budget.approved_at is not None, f"{status} budget missing approved_at"
+        assert budget.approved_by is not None, f"{status} budget missing approved_by"
+        assert budget.approved_at is not None, f"{status} budget missing approved_at"
 
     def test_draft_budgets_have_no_approval_metadata(self):
         """
@@ -238,30 +245,24 @@ class TestBudgetInvariants:
 
         Draft budgets should not have approval data.
         """
-        property_obj = PropertyGenerator.create()
-
-        budget = BudgetGenerator.create(
-            tenant_id=property_obj.tenant_id,
-            status=BudgetStatus.DRAFT,
-        )
+        budget = BudgetGenerator.create(status=BudgetStatus.DRAFT)
 
         # Draft budgets created without explicit approval should have None
         # (Note: generator might set these for DRAFT, this tests the model constraint)
         assert budget.status == BudgetStatus.DRAFT
 
+    @low_variability_settings
     @given(
-        fiscal_year=fiscal_year_strategy(),
+        fiscal_year=FISCAL_YEAR,
     )
-    def test_fiscal_year_matches_date_range(self, fiscal_year):
+    def test_fiscal_year_matches_date_range(self, tenant_id, fiscal_year):
         """
         INVARIANT: Fiscal year should align with budget date range.
 
         The fiscal_year field should correspond to the budget period.
         """
-        property_obj = PropertyGenerator.create()
-
         budget = BudgetGenerator.create(
-            tenant_id=property_obj.tenant_id,
+            tenant_id=tenant_id,
             fiscal_year=fiscal_year,
             start_date=date(fiscal_year, 1, 1),
             end_date=date(fiscal_year, 12, 31),
@@ -275,22 +276,24 @@ class TestBudgetInvariants:
 class TestVarianceReportInvariants:
     """Property-based tests for variance report invariants."""
 
+    @budget_settings
     @given(
-        total_budgeted=budget_amount_strategy(),
-        total_actual=budget_amount_strategy(),
+        total_budgeted=BUDGET_AMOUNT,
+        total_actual=BUDGET_AMOUNT,
     )
-    def test_variance_report_totals_consistency(self, total_budgeted, total_actual):
+    # Percentage edges: on budget (0%), nothing spent (+100%), double spend (-100%)
+    @example(total_budgeted=Decimal("1000.00"), total_actual=Decimal("1000.00"))
+    @example(total_budgeted=Decimal("1000.00"), total_actual=Decimal("0.00"))
+    @example(total_budgeted=Decimal("1000.00"), total_actual=Decimal("2000.00"))
+    def test_variance_report_totals_consistency(self, budget, total_budgeted, total_actual):
         """
         INVARIANT: Variance report totals must be mathematically consistent.
 
         - total_variance = total_budgeted - total_actual
         - variance_percentage = (total_variance / total_budgeted) * 100
         """
-        property_obj = PropertyGenerator.create()
-        budget = BudgetGenerator.create(tenant_id=property_obj.tenant_id)
-
         report = BudgetGenerator.create_variance_report(
-            tenant_id=property_obj.tenant_id,
+            tenant_id=budget.tenant_id,
             budget_id=budget.id,
             budget_name=budget.name,
             fiscal_year=budget.fiscal_year,
@@ -304,27 +307,25 @@ class TestVarianceReportInvariants:
         expected_variance = total_budgeted - total_actual
         assert report.total_variance == expected_variance
 
-        # Verify percentage calculation (if budget is non-zero)
-        if total_budgeted != Decimal("0.00"):
-            expected_pct = (expected_variance / total_budgeted * Decimal("100")).quantize(Decimal("0.01"))
-            assert report.variance_percentage == expected_pct
+        # Verify percentage calculation (budget is always >= $100, never zero)
+        expected_pct = (expected_variance / total_budgeted * HUNDRED).quantize(CENT)
+        assert report.variance_percentage == expected_pct
 
+    @budget_settings
     @given(
-        total_budgeted=budget_amount_strategy(),
+        total_budgeted=BUDGET_AMOUNT,
     )
-    def test_favorable_variance_definition(self, total_budgeted):
+    @example(total_budgeted=Decimal("100.00"))  # Smallest budget: 10% is still $10
+    def test_favorable_variance_definition(self, budget, total_budgeted):
         """
         INVARIANT: Favorable variance means under budget (variance > 0).
         """
-        property_obj = PropertyGenerator.create()
-        budget = BudgetGenerator.create(tenant_id=property_obj.tenant_id)
-
         # Create report with actual less than budget (favorable)
         # Quantize to avoid precision issues
-        total_actual = (total_budgeted * Decimal("0.90")).quantize(Decimal("0.01"))
+        total_actual = (total_budgeted * UNDER_SPEND).quantize(CENT)
 
         report = BudgetGenerator.create_variance_report(
-            tenant_id=property_obj.tenant_id,
+            tenant_id=budget.tenant_id,
             budget_id=budget.id,
             budget_name=budget.name,
             fiscal_year=budget.fiscal_year,
@@ -335,26 +336,25 @@ class TestVarianceReportInvariants:
         )
 
         # Variance should be positive (favorable)
-        assert report.total_variance > Decimal("0.00")
+        assert report.total_variance > ZERO
         assert report.is_favorable() is True
         assert report.is_unfavorable() is False
 
+    @budget_settings
     @given(
-        total_budgeted=budget_amount_strategy(),
+        total_budgeted=BUDGET_AMOUNT,
     )
-    def test_unfavorable_variance_definition(self, total_budgeted):
+    @example(total_budgeted=Decimal("100.00"))  # Smallest budget: 10% is still $10
+    def test_unfavorable_variance_definition(self, budget, total_budgeted):
         """
         INVARIANT: Unfavorable variance means over budget (variance < 0).
         """
-        property_obj = PropertyGenerator.create()
-        budget = BudgetGenerator.create(tenant_id=property_obj.tenant_id)
-
         # Create report with actual more than budget (unfavorable)
         # Quantize to avoid precision issues
-        total_actual = (total_budgeted * Decimal("1.10")).quantize(Decimal("0.01"))
+        total_actual = (total_budgeted * OVER_SPEND).quantize(CENT)
 
         report = BudgetGenerator.create_variance_report(
-            tenant_id=property_obj.tenant_id,
+            tenant_id=budget.tenant_id,
             budget_id=budget.id,
             budget_name=budget.name,
             fiscal_year=budget.fiscal_year,
@@ -365,7 +365,7 @@ class TestVarianceReportInvariants:
         )
 
         # Variance should be negative (unfavorable)
-        assert report.total_variance < Decimal("0.00")
+        assert report.total_variance < ZERO
         assert report.is_unfavorable() is True
         assert report.is_favorable() is False
 
@@ -373,26 +373,23 @@ class TestVarianceReportInvariants:
 class TestBudgetDataTypeInvariants:
     """Property-based tests for budget data type invariants."""
 
-    @given(
-        num_lines=st.integers(min_value=1, max_value=10),
-    )
-    def test_all_amounts_use_decimal_with_2_places(self, num_lines):
+    def test_all_amounts_use_decimal_with_2_places(self, tenant_id):
         """
         INVARIANT: All money amounts must use Decimal with exactly 2 decimal places.
 
         This ensures NUMERIC(15,2) compatibility and prevents floating-point errors.
+        BudgetLine normalizes budgeted_amount at construction, so one line built
+        from an unnormalized amount is enough to check the contract.
         """
-        property_obj = PropertyGenerator.create()
-
-        _, lines = BudgetGenerator.create_with_lines(
-            tenant_id=property_obj.tenant_id,
-            num_lines=num_lines,
+        line = BudgetGenerator.create_budget_line(
+            tenant_id=tenant_id,
+            budget_id=uuid4(),
+            budgeted_amount=Decimal("1234.5"),
         )
 
-        for line in lines:
-            assert isinstance(line.budgeted_amount, Decimal)
-            # Verify exactly 2 decimal places
-            assert line.budgeted_amount.as_tuple().exponent == -2
+        assert isinstance(line.budgeted_amount, Decimal)
+        # Verify exactly 2 decimal places
+        assert line.budgeted_amount.as_tuple().exponent == -2
 
     def test_all_dates_use_date_not_datetime(self):
         """
@@ -400,9 +397,7 @@ class TestBudgetDataTypeInvariants:
 
         This ensures DATE type compatibility in the database.
         """
-        property_obj = PropertyGenerator.create()
-
-        budget = BudgetGenerator.create(tenant_id=property_obj.tenant_id)
+        budget = BudgetGenerator.create()
 
         assert isinstance(budget.start_date, date)
         assert isinstance(budget.end_date, date)
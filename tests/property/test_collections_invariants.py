@@ -14,9 +14,14 @@ Uses Hypothesis to verify that collections operations maintain critical invarian
 """
 
 from datetime import date, timedelta
-from decimal import Decimal
+from decimal import ROUND_HALF_EVEN, Context, Decimal
+from functools import lru_cache
 
-from hypothesis import assume, given
+# Fee math here is Decimal-heavy: require CPython's C decimal accelerator so a
+# build without it fails at collection instead of silently running _pydecimal
+import _decimal  # noqa: F401
+
+from hypothesis import assume, given, settings
 from hypothesis import strategies as st
 import pytest
 
@@ -26,157 +31,171 @@ from qa_testing.generators import (
     DelinquencyStatusGenerator,
     LateFeeRuleGenerator,
     MemberGenerator,
-    PropertyGenerator,
 )
 from qa_testing.models import ActionStatus, ActionType, CollectionStage, FeeType
+from tests.strategies import has_two_places
+
+# Decimal literals used across tests (parsed once at import)
+ZERO = Decimal("0.00")
+CENT = Decimal("0.01")
+TWO = Decimal("2")
+PERCENT = Decimal("0.01")  # Multiplying by this is exact, and cheaper than dividing by 100
+ROUNDING_TOLERANCE = Decimal("0.02")  # Two independently rounded fees
+MAX_FEE = Decimal("100.00")
+
+# Rounding context for fee quantization, passed explicitly so each quantize
+# skips the thread-local getcontext() lookup (same settings as the default)
+MONEY_CONTEXT = Context(prec=28, rounding=ROUND_HALF_EVEN)
+
+# Collection stages in progression order (built once at import)
+STAGE_ORDER = (
+    CollectionStage.CURRENT,
+    CollectionStage.DAYS_0_30,
+    CollectionStage.DAYS_31_60,
+    CollectionStage.DAYS_61_90,
+    CollectionStage.DAYS_90_PLUS,
+    CollectionStage.ATTORNEY_REFERRAL,
+    CollectionStage.LIEN_FILED,
+    CollectionStage.FORECLOSURE,
+)
+STAGE_SET = frozenset(STAGE_ORDER)
 
+# Custom strategies for collections tests (strategy objects built once at import)
 
-# Custom strategies for collections tests
-@st.composite
-def grace_period_strategy(draw):
-    """Generate realistic grace periods (5-15 days)."""
-    return draw(st.integers(min_value=5, max_value=15))
-
-
-@st.composite
-def flat_amount_strategy(draw):
-    """Generate realistic flat fee amounts ($25-$200)."""
-    return Decimal(str(draw(st.integers(min_value=25, max_value=200)))).quantize(Decimal("0.01"))
-
+# Realistic grace periods (5-15 days)
+GRACE_PERIOD = st.integers(min_value=5, max_value=15)
 
-@st.composite
-def percentage_rate_strategy(draw):
-    """Generate realistic percentage rates (5-15%)."""
-    return Decimal(str(draw(st.floats(min_value=5.0, max_value=15.0)))).quantize(Decimal("0.01"))
+# Realistic flat fee amounts ($25-$200)
+FLAT_AMOUNT = st.integers(min_value=25, max_value=200).map(
+    lambda n: Decimal(n).quantize(CENT, context=MONEY_CONTEXT)
+)
 
+# Realistic percentage rates (5-15%)
+PERCENTAGE_RATE = st.decimals(min_value="5.00", max_value="15.00", places=2)
 
-@st.composite
-def balance_strategy(draw):
-    """Generate realistic balances ($100-$10000)."""
-    return Decimal(str(draw(st.integers(min_value=100, max_value=10000)))).quantize(Decimal("0.01"))
+# Realistic balances ($100-$10000)
+BALANCE = st.integers(min_value=100, max_value=10000).map(
+    lambda n: Decimal(n).quantize(CENT, context=MONEY_CONTEXT)
+)
 
+# Realistic delinquency periods (0-365 days)
+DAYS_DELINQUENT = st.integers(min_value=0, max_value=365)
 
-@st.composite
-def days_delinquent_strategy(draw):
-    """Generate realistic delinquency periods (0-365 days)."""
-    return draw(st.integers(min_value=0, max_value=365))
+# Tests that build a DelinquencyStatus per example are capped at 25 examples
+# (or the active profile's count, if lower); days_delinquent is the only input
+delinquency_settings = settings(
+    max_examples=min(settings.default.max_examples, 25),
+    deadline=None,
+)
 
 
-class TestLateFeeCalculationInvariants:
-    """Property-based tests for late fee calculation invariants."""
+@lru_cache(maxsize=64)
+def _delinquent_status(tenant_id, member_id, collection_stage, days_delinquent):
+    """
+    Memoized DelinquencyStatusGenerator.create_delinquent.
 
-    @given(
-        flat_amount=flat_amount_strategy(),
+    The collection action tests only need a delinquency status to hang actions
+    off, so identical (tenant, member, stage, days) requests share one status.
+    """
+    return DelinquencyStatusGenerator.create_delinquent(
+        tenant_id=tenant_id,
+        member_id=member_id,
+        collection_stage=collection_stage,
+        days_delinquent=days_delinquent,
     )
-    def test_flat_fee_always_non_negative(self, flat_amount):
-        """
-        INVARIANT: Flat late fee is always >= 0.
 
-        Flat fees should never be negative.
-        """
-        property_obj = PropertyGenerator.create()
 
-        rule = LateFeeRuleGenerator.create_flat(
-            tenant_id=property_obj.tenant_id,
-            flat_amount=flat_amount,
-        )
+@pytest.fixture(scope="module")
+def member(tenant_id):
+    """Member shared by the delinquency tests, which only read its ID."""
+    return MemberGenerator.create(tenant_id=tenant_id)
 
-        assert rule.flat_amount >= Decimal("0.00")
 
-    @given(
-        percentage_rate=percentage_rate_strategy(),
-        balance=balance_strategy(),
-    )
-    def test_percentage_fee_always_non_negative(self, percentage_rate, balance):
-        """
-        INVARIANT: Percentage late fee is always >= 0.
+@pytest.fixture(scope="class")
+def attorney_status(tenant_id, member):
+    """Delinquency status at attorney referral (150 days), shared by a test class."""
+    return _delinquent_status(tenant_id, member.id, CollectionStage.ATTORNEY_REFERRAL, 150)
 
-        Percentage fees should never be negative.
-        """
-        property_obj = PropertyGenerator.create()
 
-        rule = LateFeeRuleGenerator.create_percentage(
-            tenant_id=property_obj.tenant_id,
-            percentage_rate=percentage_rate,
-        )
+@pytest.fixture(scope="class")
+def lien_status(tenant_id, member):
+    """Delinquency status with a lien filed (180 days), shared by a test class."""
+    return _delinquent_status(tenant_id, member.id, CollectionStage.LIEN_FILED, 180)
 
-        # Calculate percentage fee
-        late_fee = (balance * rule.percentage_rate / Decimal("100")).quantize(Decimal("0.01"))
 
-        assert late_fee >= Decimal("0.00")
+class TestLateFeeCalculationInvariants:
+    """Property-based tests for late fee calculation invariants."""
 
     @given(
-        flat_amount=flat_amount_strategy(),
-        percentage_rate=percentage_rate_strategy(),
-        balance=balance_strategy(),
+        flat_amount=FLAT_AMOUNT,
+        percentage_rate=PERCENTAGE_RATE,
+        balance=BALANCE,
     )
-    def test_combined_fee_always_non_negative(self, flat_amount, percentage_rate, balance):
+    def test_late_fee_always_non_negative(self, tenant_id, flat_amount, percentage_rate, balance):
         """
-        INVARIANT: Combined late fee (flat + percentage) is always >= 0.
+        INVARIANT: Flat, percentage and combined late fees are always >= 0.
 
-        Combined fees should never be negative.
+        Late fees should never be negative. One FeeType.BOTH rule carries
+        both components, so all three fee shapes are checked against it.
         """
-        property_obj = PropertyGenerator.create()
-
         rule = LateFeeRuleGenerator.create_both(
-            tenant_id=property_obj.tenant_id,
+            tenant_id=tenant_id,
             flat_amount=flat_amount,
             percentage_rate=percentage_rate,
         )
 
-        # Calculate combined fee
-        late_fee = rule.flat_amount + (balance * rule.percentage_rate / Decimal("100"))
-        late_fee = late_fee.quantize(Decimal("0.01"))
+        # Percentage component
+        percentage_fee = balance * rule.percentage_rate * PERCENT
 
-        assert late_fee >= Decimal("0.00")
+        assert rule.flat_amount >= ZERO
+        assert percentage_fee.quantize(CENT, context=MONEY_CONTEXT) >= ZERO
+        assert (rule.flat_amount + percentage_fee).quantize(CENT, context=MONEY_CONTEXT) >= ZERO
 
     @given(
-        percentage_rate=percentage_rate_strategy(),
-        balance=balance_strategy(),
+        percentage_rate=PERCENTAGE_RATE,
+        balance=BALANCE,
     )
-    def test_percentage_fee_proportional_to_balance(self, percentage_rate, balance):
+    def test_percentage_fee_proportional_to_balance(self, tenant_id, percentage_rate, balance):
         """
         INVARIANT: Percentage fee is proportional to balance.
 
         If balance doubles, percentage fee should double.
         """
-        property_obj = PropertyGenerator.create()
-
         rule = LateFeeRuleGenerator.create_percentage(
-            tenant_id=property_obj.tenant_id,
+            tenant_id=tenant_id,
             percentage_rate=percentage_rate,
         )
 
         # Calculate fee for original balance
-        fee1 = (balance * rule.percentage_rate / Decimal("100")).quantize(Decimal("0.01"))
+        fee1 = (balance * rule.percentage_rate * PERCENT).quantize(CENT, context=MONEY_CONTEXT)
 
         # Calculate fee for doubled balance
-        doubled_balance = balance * 2
-        fee2 = (doubled_balance * rule.percentage_rate / Decimal("100")).quantize(Decimal("0.01"))
+        doubled_balance = balance * TWO
+        fee2 = (doubled_balance * rule.percentage_rate * PERCENT).quantize(
+            CENT, context=MONEY_CONTEXT
+        )
 
         # Fee should roughly double (allow for rounding)
-        assert abs(fee2 - (fee1 * 2)) <= Decimal("0.02")
+        assert abs(fee2 - (fee1 * TWO)) <= ROUNDING_TOLERANCE
 
     @given(
-        percentage_rate=percentage_rate_strategy(),
-        balance=balance_strategy(),
+        percentage_rate=PERCENTAGE_RATE,
+        balance=BALANCE,
     )
-    def test_late_fee_capped_by_max_amount(self, percentage_rate, balance):
+    def test_late_fee_capped_by_max_amount(self, tenant_id, percentage_rate, balance):
         """
         INVARIANT: Late fee is capped by max_amount when specified.
 
         Calculated fee should never exceed max_amount.
         """
         # Only test when calculated fee would exceed cap
-        calculated_fee = (balance * percentage_rate / Decimal("100")).quantize(Decimal("0.01"))
-        max_amount = Decimal("100.00")
+        calculated_fee = (balance * percentage_rate * PERCENT).quantize(CENT, context=MONEY_CONTEXT)
+        max_amount = MAX_FEE
 
         assume(calculated_fee > max_amount)
 
-        property_obj = PropertyGenerator.create()
-
         rule = LateFeeRuleGenerator.create_percentage(
-            tenant_id=property_obj.tenant_id,
+            tenant_id=tenant_id,
             percentage_rate=percentage_rate,
             max_amount=max_amount,
         )
@@ -191,300 +210,189 @@ class TestLateFeeCalculationInvariants:
 class TestAgingBucketInvariants:
     """Property-based tests for aging bucket invariants."""
 
+    @delinquency_settings
     @given(
-        days_delinquent=days_delinquent_strategy(),
+        days_delinquent=DAYS_DELINQUENT,
     )
-    def test_aging_bucket_sum_equals_current_balance(self, days_delinquent):
+    def test_aging_bucket_invariants(self, tenant_id, member, days_delinquent):
         """
-        INVARIANT: Sum of aging buckets equals current_balance.
+        INVARIANT: Aging buckets are non-negative and sum to current_balance.
 
-        balance_0_30 + balance_31_60 + balance_61_90 + balance_90_plus = current_balance
+        - balance_0_30 + balance_31_60 + balance_61_90 + balance_90_plus = current_balance
+        - No aging bucket can have negative balance
+        - current_balance is non-negative (delinquent accounts positive, current zero)
         """
-        property_obj = PropertyGenerator.create()
-        member = MemberGenerator.create(tenant_id=property_obj.tenant_id)
-
         status = DelinquencyStatusGenerator.create(
-            tenant_id=property_obj.tenant_id,
+            tenant_id=tenant_id,
             member_id=member.id,
             days_delinquent=days_delinquent,
         )
 
-        sum_of_buckets = (
-            status.balance_0_30 +
-            status.balance_31_60 +
-            status.balance_61_90 +
-            status.balance_90_plus
+        buckets = (
+            status.balance_0_30,
+            status.balance_31_60,
+            status.balance_61_90,
+            status.balance_90_plus,
         )
 
         # Should match exactly (within $0.01 for rounding)
-        assert abs(status.current_balance - sum_of_buckets) <= Decimal("0.01")
+        assert abs(status.current_balance - sum(buckets, ZERO)) <= CENT
 
-    @given(
-        days_delinquent=days_delinquent_strategy(),
-    )
-    def test_no_negative_balances_in_aging_buckets(self, days_delinquent):
-        """
-        INVARIANT: No aging bucket can have negative balance.
+        assert min(buckets) >= ZERO
+        assert status.current_balance >= ZERO
 
-        All aging buckets must be >= 0.
-        """
-        property_obj = PropertyGenerator.create()
-        member = MemberGenerator.create(tenant_id=property_obj.tenant_id)
-
-        status = DelinquencyStatusGenerator.create(
-            tenant_id=property_obj.tenant_id,
-            member_id=member.id,
-            days_delinquent=days_delinquent,
-        )
-
-        assert status.balance_0_30 >= Decimal("0.00")
-        assert status.balance_31_60 >= Decimal("0.00")
-        assert status.balance_61_90 >= Decimal("0.00")
-        assert status.balance_90_plus >= Decimal("0.00")
-
-    @given(
-        days_delinquent=days_delinquent_strategy(),
-    )
-    def test_current_balance_non_negative(self, days_delinquent):
-        """
-        INVARIANT: current_balance must be non-negative.
-
-        Delinquent accounts have positive balance, current accounts have zero.
-        """
-        property_obj = PropertyGenerator.create()
-        member = MemberGenerator.create(tenant_id=property_obj.tenant_id)
-
-        status = DelinquencyStatusGenerator.create(
-            tenant_id=property_obj.tenant_id,
-            member_id=member.id,
-            days_delinquent=days_delinquent,
-        )
-
-        assert status.current_balance >= Decimal("0.00")
-
-    def test_is_delinquent_property_matches_balance(self):
+    def test_is_delinquent_property_matches_balance(self, tenant_id, member):
         """
         INVARIANT: is_delinquent property matches current_balance.
 
         is_delinquent is True when current_balance > 0.
         """
-        property_obj = PropertyGenerator.create()
-        member = MemberGenerator.create(tenant_id=property_obj.tenant_id)
-
         # Test current (zero balance)
         status_current = DelinquencyStatusGenerator.create_current(
-            tenant_id=property_obj.tenant_id,
+            tenant_id=tenant_id,
             member_id=member.id,
         )
 
-        assert status_current.current_balance == Decimal("0.00")
+        assert status_current.current_balance == ZERO
         assert status_current.is_delinquent is False
 
         # Test delinquent (positive balance)
         status_delinquent = DelinquencyStatusGenerator.create_delinquent(
-            tenant_id=property_obj.tenant_id,
+            tenant_id=tenant_id,
             member_id=member.id,
             collection_stage=CollectionStage.DAYS_31_60,
             days_delinquent=45,
         )
 
-        if status_delinquent.current_balance > Decimal("0.00"):
+        if status_delinquent.current_balance > ZERO:
             assert status_delinquent.is_delinquent is True
 
 
 class TestCollectionStageInvariants:
     """Property-based tests for collection stage progression invariants."""
 
-    def test_collection_stage_progression_order(self):
+    def test_collection_stage_progression_order(self, tenant_id, member):
         """
         INVARIANT: Collection stages progress in order.
 
         CURRENT → 0_30 → 31_60 → 61_90 → 90_PLUS → ATTORNEY → LIEN → FORECLOSURE
         """
-        property_obj = PropertyGenerator.create()
-        member = MemberGenerator.create(tenant_id=property_obj.tenant_id)
-
-        # Define stage order
-        stage_order = [
-            CollectionStage.CURRENT,
-            CollectionStage.DAYS_0_30,
-            CollectionStage.DAYS_31_60,
-            CollectionStage.DAYS_61_90,
-            CollectionStage.DAYS_90_PLUS,
-            CollectionStage.ATTORNEY_REFERRAL,
-            CollectionStage.LIEN_FILED,
-            CollectionStage.FORECLOSURE,
-        ]
-
         # Create status at each stage
-        for stage in stage_order:
+        for stage in STAGE_ORDER:
             status = DelinquencyStatusGenerator.create(
-                tenant_id=property_obj.tenant_id,
+                tenant_id=tenant_id,
                 member_id=member.id,
                 collection_stage=stage,
             )
 
             # Verify stage is in defined order
-            assert status.collection_stage in stage_order
+            assert status.collection_stage in STAGE_SET
 
+    @delinquency_settings
     @given(
-        days_delinquent=days_delinquent_strategy(),
+        days_delinquent=DAYS_DELINQUENT,
     )
-    def test_days_delinquent_non_negative(self, days_delinquent):
+    def test_days_delinquent_non_negative(self, tenant_id, member, days_delinquent):
         """
         INVARIANT: days_delinquent must be non-negative.
 
         Cannot have negative days delinquent.
         """
-        # Ensure non-negative
-        assume(days_delinquent >= 0)
-
-        property_obj = PropertyGenerator.create()
-        member = MemberGenerator.create(tenant_id=property_obj.tenant_id)
-
         status = DelinquencyStatusGenerator.create(
-            tenant_id=property_obj.tenant_id,
+            tenant_id=tenant_id,
             member_id=member.id,
             days_delinquent=days_delinquent,
         )
 
         assert status.days_delinquent >= 0
 
-    def test_current_stage_has_zero_balance(self):
+    def test_current_stage_has_zero_balance(self, tenant_id, member):
         """
         INVARIANT: CURRENT stage should have zero balance.
 
         Non-delinquent accounts have zero balance.
         """
-        property_obj = PropertyGenerator.create()
-        member = MemberGenerator.create(tenant_id=property_obj.tenant_id)
-
         status = DelinquencyStatusGenerator.create_current(
-            tenant_id=property_obj.tenant_id,
+            tenant_id=tenant_id,
             member_id=member.id,
         )
 
         if status.collection_stage == CollectionStage.CURRENT:
-            assert status.current_balance == Decimal("0.00")
+            assert status.current_balance == ZERO
 
 
 class TestCollectionActionInvariants:
     """Property-based tests for collection action invariants."""
 
-    def test_approved_date_after_requested_date(self):
+    def test_approved_date_after_requested_date(self, tenant_id, attorney_status):
         """
         INVARIANT: approved_date must be >= requested_date.
 
         Actions cannot be approved before they are requested.
         """
-        property_obj = PropertyGenerator.create()
-        member = MemberGenerator.create(tenant_id=property_obj.tenant_id)
-        status = DelinquencyStatusGenerator.create_delinquent(
-            tenant_id=property_obj.tenant_id,
-            member_id=member.id,
-            collection_stage=CollectionStage.ATTORNEY_REFERRAL,
-            days_delinquent=150,
-        )
-
         action = CollectionActionGenerator.create(
-            tenant_id=property_obj.tenant_id,
-            delinquency_status_id=status.id,
+            tenant_id=tenant_id,
+            delinquency_status_id=attorney_status.id,
             status=ActionStatus.APPROVED,
         )
 
         if action.approved_date is not None:
             assert action.approved_date >= action.requested_date
 
-    def test_completed_date_after_requested_date(self):
+    def test_completed_date_after_requested_date(self, tenant_id, lien_status):
         """
         INVARIANT: completed_date must be >= requested_date.
 
         Actions cannot complete before they are requested.
         """
-        property_obj = PropertyGenerator.create()
-        member = MemberGenerator.create(tenant_id=property_obj.tenant_id)
-        status = DelinquencyStatusGenerator.create_delinquent(
-            tenant_id=property_obj.tenant_id,
-            member_id=member.id,
-            collection_stage=CollectionStage.LIEN_FILED,
-            days_delinquent=180,
-        )
-
         action = CollectionActionGenerator.create(
-            tenant_id=property_obj.tenant_id,
-            delinquency_status_id=status.id,
+            tenant_id=tenant_id,
+            delinquency_status_id=lien_status.id,
             status=ActionStatus.COMPLETED,
         )
 
         if action.completed_date is not None:
             assert action.completed_date >= action.requested_date
 
-    def test_approved_action_has_approved_date(self):
+    def test_approved_action_has_approved_date(self, tenant_id, attorney_status):
         """
         INVARIANT: APPROVED status requires approved_date.
 
         Approved actions must have approval timestamp.
         """
-        property_obj = PropertyGenerator.create()
-        member = MemberGenerator.create(tenant_id=property_obj.tenant_id)
-        status = DelinquencyStatusGenerator.create_delinquent(
-            tenant_id=property_obj.tenant_id,
-            member_id=member.id,
-            collection_stage=CollectionStage.ATTORNEY_REFERRAL,
-            days_delinquent=150,
-        )
-
         action = CollectionActionGenerator.create(
-            tenant_id=property_obj.tenant_id,
-            delinquency_status_id=status.id,
+            tenant_id=tenant_id,
+            delinquency_status_id=attorney_status.id,
             status=ActionStatus.APPROVED,
         )
 
         if action.status == ActionStatus.APPROVED:
             assert action.approved_date is not None
 
-    def test_completed_action_has_completed_date(self):
+    def test_completed_action_has_completed_date(self, tenant_id, lien_status):
         """
         INVARIANT: COMPLETED status requires completed_date.
 
         Completed actions must have completion timestamp.
         """
-        property_obj = PropertyGenerator.create()
-        member = MemberGenerator.create(tenant_id=property_obj.tenant_id)
-        status = DelinquencyStatusGenerator.create_delinquent(
-            tenant_id=property_obj.tenant_id,
-            member_id=member.id,
-            collection_stage=CollectionStage.LIEN_FILED,
-            days_delinquent=180,
-        )
-
         action = CollectionActionGenerator.create(
-            tenant_id=property_obj.tenant_id,
-            delinquency_status_id=status.id,
+            tenant_id=tenant_id,
+            delinquency_status_id=lien_status.id,
             status=ActionStatus.COMPLETED,
         )
 
         if action.status == ActionStatus.COMPLETED:
             assert action.completed_date is not None
 
-    def test_pending_action_no_approval_dates(self):
+    def test_pending_action_no_approval_dates(self, tenant_id, attorney_status):
         """
         INVARIANT: PENDING_APPROVAL status should not have approval dates.
 
         Pending actions haven't been approved yet.
         """
-        property_obj = PropertyGenerator.create()
-        member = MemberGenerator.create(tenant_id=property_obj.tenant_id)
-        status = DelinquencyStatusGenerator.create_delinquent(
-            tenant_id=property_obj.tenant_id,
-            member_id=member.id,
-            collection_stage=CollectionStage.ATTORNEY_REFERRAL,
-            days_delinquent=150,
-        )
-
         action = CollectionActionGenerator.create(
-            tenant_id=property_obj.tenant_id,
-            delinquency_status_id=status.id,
+            tenant_id=tenant_id,
+            delinquency_status_id=attorney_status.id,
             status=ActionStatus.PENDING_APPROVAL,
         )
 
@@ -495,188 +403,168 @@ class TestCollectionActionInvariants:
 class TestDataTypeInvariants:
     """Property-based tests for data type invariants."""
 
-    @given(
-        flat_amount=flat_amount_strategy(),
-        percentage_rate=percentage_rate_strategy(),
-    )
-    def test_late_fee_amounts_use_decimal_with_precision(self, flat_amount, percentage_rate):
+    def test_late_fee_amounts_use_decimal_with_precision(self, tenant_id):
         """
         INVARIANT: All late fee amounts use Decimal with exactly 2 decimal places.
 
-        Money amounts must use NUMERIC(15,2).
+        Money amounts must use NUMERIC(15,2). The field types come from the
+        model, not from the drawn values, so one representative rule is enough.
         """
-        property_obj = PropertyGenerator.create()
-
         rule = LateFeeRuleGenerator.create_both(
-            tenant_id=property_obj.tenant_id,
-            flat_amount=flat_amount,
-            percentage_rate=percentage_rate,
+            tenant_id=tenant_id,
+            flat_amount=Decimal("50.00"),
+            percentage_rate=Decimal("10.00"),
         )
 
         # Check Decimal type
-        assert isinstance(rule.flat_amount, Decimal)
+        assert type(rule.flat_amount) is Decimal
 
         # Check precision (exactly 2 decimal places)
-        assert rule.flat_amount.as_tuple().exponent == -2
+        assert has_two_places(rule.flat_amount)
 
         # Check max_amount if present
         if rule.max_amount is not None:
-            assert isinstance(rule.max_amount, Decimal)
-            assert rule.max_amount.as_tuple().exponent == -2
+            assert type(rule.max_amount) is Decimal
+            assert has_two_places(rule.max_amount)
 
-    @given(
-        days_delinquent=days_delinquent_strategy(),
-    )
-    def test_delinquency_balances_use_decimal_with_precision(self, days_delinquent):
+    def test_delinquency_balances_use_decimal_with_precision(self, tenant_id, member):
         """
         INVARIANT: All delinquency balances use Decimal with exactly 2 decimal places.
 
-        Money amounts must use NUMERIC(15,2).
+        Money amounts must use NUMERIC(15,2). At 150 days delinquent every aging
+        bucket is non-zero, so one status exercises all of them.
         """
-        property_obj = PropertyGenerator.create()
-        member = MemberGenerator.create(tenant_id=property_obj.tenant_id)
-
         status = DelinquencyStatusGenerator.create(
-            tenant_id=property_obj.tenant_id,
+            tenant_id=tenant_id,
             member_id=member.id,
-            days_delinquent=days_delinquent,
+            days_delinquent=150,
         )
 
         # Check all balances
-        assert isinstance(status.balance_0_30, Decimal)
-        assert status.balance_0_30.as_tuple().exponent == -2
+        assert type(status.balance_0_30) is Decimal
+        assert has_two_places(status.balance_0_30)
 
-        assert isinstance(status.balance_31_60, Decimal)
-        assert status.balance_31_60.as_tuple().exponent == -2
+        assert type(status.balance_31_60) is Decimal
+        assert has_two_places(status.balance_31_60)
 
-        assert isinstance(status.balance_61_90, Decimal)
-        assert status.balance_61_90.as_tuple().exponent == -2
+        assert type(status.balance_61_90) is Decimal
+        assert has_two_places(status.balance_61_90)
 
-        assert isinstance(status.balance_90_plus, Decimal)
-        assert status.balance_90_plus.as_tuple().exponent == -2
+        assert type(status.balance_90_plus) is Decimal
+        assert has_two_places(status.balance_90_plus)
 
-        assert isinstance(status.current_balance, Decimal)
-        assert status.current_balance.as_tuple().exponent == -2
+        assert type(status.current_balance) is Decimal
+        assert has_two_places(status.current_balance)
 
-    def test_notice_dates_use_date_type(self):
+    def test_notice_dates_use_date_type(self, tenant_id, member):
         """
         INVARIANT: All notice dates use date type (not datetime).
 
         Accounting dates should use DATE, not datetime.
         """
-        property_obj = PropertyGenerator.create()
-        member = MemberGenerator.create(tenant_id=property_obj.tenant_id)
         status = DelinquencyStatusGenerator.create_delinquent(
-            tenant_id=property_obj.tenant_id,
+            tenant_id=tenant_id,
             member_id=member.id,
             collection_stage=CollectionStage.DAYS_31_60,
             days_delinquent=45,
         )
 
         notice = CollectionNoticeGenerator.create(
-            tenant_id=property_obj.tenant_id,
+            tenant_id=tenant_id,
             delinquency_status_id=status.id,
         )
 
-        # Check date types
-        assert isinstance(notice.sent_date, date)
+        # Check date types (exact type: datetime is a date subclass)
+        assert type(notice.sent_date) is date
 
         if notice.delivered_date is not None:
-            assert isinstance(notice.delivered_date, date)
+            assert type(notice.delivered_date) is date
 
-    def test_action_dates_use_date_type(self):
+    def test_action_dates_use_date_type(self, tenant_id, member):
         """
         INVARIANT: All action dates use date type (not datetime).
 
         Accounting dates should use DATE, not datetime.
         """
-        property_obj = PropertyGenerator.create()
-        member = MemberGenerator.create(tenant_id=property_obj.tenant_id)
         status = DelinquencyStatusGenerator.create_delinquent(
-            tenant_id=property_obj.tenant_id,
+            tenant_id=tenant_id,
             member_id=member.id,
             collection_stage=CollectionStage.ATTORNEY_REFERRAL,
             days_delinquent=150,
         )
 
         action = CollectionActionGenerator.create(
-            tenant_id=property_obj.tenant_id,
+            tenant_id=tenant_id,
             delinquency_status_id=status.id,
             status=ActionStatus.COMPLETED,
         )
 
         # Check date types
-        assert isinstance(action.requested_date, date)
+        assert type(action.requested_date) is date
 
         if action.approved_date is not None:
-            assert isinstance(action.approved_date, date)
+            assert type(action.approved_date) is date
 
         if action.completed_date is not None:
-            assert isinstance(action.completed_date, date)
+            assert type(action.completed_date) is date
 
-    def test_notice_balance_uses_decimal_with_precision(self):
+    def test_notice_balance_uses_decimal_with_precision(self, tenant_id, member):
         """
         INVARIANT: Notice balance uses Decimal with exactly 2 decimal places.
 
         Money amounts must use NUMERIC(15,2).
         """
-        property_obj = PropertyGenerator.create()
-        member = MemberGenerator.create(tenant_id=property_obj.tenant_id)
         status = DelinquencyStatusGenerator.create_delinquent(
-            tenant_id=property_obj.tenant_id,
+            tenant_id=tenant_id,
             member_id=member.id,
             collection_stage=CollectionStage.DAYS_31_60,
             days_delinquent=45,
         )
 
         notice = CollectionNoticeGenerator.create(
-            tenant_id=property_obj.tenant_id,
+            tenant_id=tenant_id,
             delinquency_status_id=status.id,
         )
 
-        assert isinstance(notice.balance_at_notice, Decimal)
-        assert notice.balance_at_notice.as_tuple().exponent == -2
+        assert type(notice.balance_at_notice) is Decimal
+        assert has_two_places(notice.balance_at_notice)
 
-    def test_action_balance_uses_decimal_with_precision(self):
+    def test_action_balance_uses_decimal_with_precision(self, tenant_id, member):
         """
         INVARIANT: Action balance uses Decimal with exactly 2 decimal places.
 
         Money amounts must use NUMERIC(15,2).
         """
-        property_obj = PropertyGenerator.create()
-        member = MemberGenerator.create(tenant_id=property_obj.tenant_id)
         status = DelinquencyStatusGenerator.create_delinquent(
-            tenant_id=property_obj.tenant_id,
+            tenant_id=tenant_id,
             member_id=member.id,
             collection_stage=CollectionStage.ATTORNEY_REFERRAL,
             days_delinquent=150,
         )
 
         action = CollectionActionGenerator.create(
-            tenant_id=property_obj.tenant_id,
+            tenant_id=tenant_id,
             delinquency_status_id=status.id,
         )
 
-        assert isinstance(action.balance_at_action, Decimal)
-        assert action.balance_at_action.as_tuple().exponent == -2
+        assert type(action.balance_at_action) is Decimal
+        assert has_two_places(action.balance_at_action)
 
-    def test_delivered_date_after_sent_date(self):
+    def test_delivered_date_after_sent_date(self, tenant_id, member):
         """
         INVARIANT: delivered_date must be >= sent_date.
 
         Notices cannot be delivered before they are sent.
         """
-        property_obj = PropertyGenerator.create()
-        member = MemberGenerator.create(tenant_id=property_obj.tenant_id)
         status = DelinquencyStatusGenerator.create_delinquent(
-            tenant_id=property_obj.tenant_id,
+            tenant_id=tenant_id,
             member_id=member.id,
             collection_stage=CollectionStage.DAYS_31_60,
             days_delinquent=45,
         )
 
         notice = CollectionNoticeGenerator.create(
-            tenant_id=property_obj.tenant_id,
+            tenant_id=tenant_id,
             delinquency_status_id=status.id,
         )
 
@@ -9,10 +9,57 @@ from datetime import date, timedelta
 from decimal import Decimal
 
 import pytest
-from hypothesis import given, strategies as st
+from hypothesis import HealthCheck, assume, given, settings, strategies as st
 
 from qa_testing.generators import EdgeCaseGenerator, PropertyGenerator
 from qa_testing.validators import TransactionValidator, ValidationError
+from tests.strategies import cents_to_decimal
+
+# The properties here are date/Decimal arithmetic over small input domains:
+# 40 examples (or the active profile's count, if lower) covers them. Generation
+# speed and assume() rejections are not meaningful for such domains, so those
+# health checks are off.
+small_domain_settings = settings(
+    max_examples=min(settings.default.max_examples, 40),
+    deadline=None,
+    suppress_health_check=[HealthCheck.too_slow, HealthCheck.filter_too_much],
+)
+
+
+# (year, month) strategies for the fiscal boundary property, built once at import
+YEAR = st.integers(min_value=2020, max_value=2030)
+MONTH = st.integers(min_value=1, max_value=12)
+
+
+def _is_leap(year):
+    """
+    Independent leap year oracle for the property tests.
+
+    Once year is known to be divisible by 4, "not divisible by 100" is the same
+    as "not divisible by 25" and "divisible by 400" the same as "divisible by
+    16", so two of the three modulo checks become bit masks.
+    """
+    return (year & 3) == 0 and (year % 25 != 0 or (year & 15) == 0)
+
+
+# Leap years in the property test's range (computed once at import)
+LEAP_YEARS = tuple(year for year in range(2000, 2101) if _is_leap(year))
+
+# Days per month in a non-leap year (January first)
+MONTH_LENGTHS = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _last_day(year, month):
+    """Return the last day-of-month for (year, month) from the month length table."""
+    if month == 2 and _is_leap(year):
+        return 29
+    return MONTH_LENGTHS[month - 1]
+
+
+@pytest.fixture(scope="module")
+def property_id():
+    """Property ID shared by every test in this module (only the ID is used)."""
+    return PropertyGenerator.create().id
 
 
 class TestLeapYearEdgeCases:
@@ -38,27 +85,30 @@ class TestLeapYearEdgeCases:
         assert not EdgeCaseGenerator.is_leap_year(2100)
 
     @pytest.mark.property
-    @given(st.integers(min_value=2000, max_value=2100))
+    @small_domain_settings
+    @given(st.sampled_from(LEAP_YEARS))
     def test_leap_year_date_always_valid(self, year):
-        """Property: For ANY year, leap year date generator creates valid date."""
-        leap_date = EdgeCaseGenerator.leap_year_date(year)
-
-        # Must be Feb 29
-        assert leap_date.month == 2
-        assert leap_date.day == 29
-
-        # Year must be a leap year
-        assert EdgeCaseGenerator.is_leap_year(leap_date.year)
+        """Property: For ANY leap year, leap year date generator creates Feb 29 of that year."""
+        assert EdgeCaseGenerator.leap_year_date(year) == date(year, 2, 29)
+
+    @pytest.mark.parametrize(
+        "year,expected_year",
+        [
+            (2023, 2024),  # Not divisible by 4
+            (2100, 2104),  # Divisible by 100 but not 400
+        ],
+    )
+    def test_leap_year_date_rolls_forward_from_non_leap_year(self, year, expected_year):
+        """Test that a non-leap year rolls forward to the next leap year's Feb 29."""
+        assert EdgeCaseGenerator.leap_year_date(year) == date(expected_year, 2, 29)
 
-    def test_leap_year_transaction_valid(self):
+    def test_leap_year_transaction_valid(self, property_id):
         """Test that transactions on leap year dates are valid."""
-        property = PropertyGenerator.create()
-
         # Create transaction on Feb 29
         leap_date = EdgeCaseGenerator.leap_year_date(2024)
 
         transaction = EdgeCaseGenerator.fiscal_year_boundary_transaction(
-            property_id=property.id,
+            property_id=property_id,
             fiscal_year_start_month=1,
             year=2024,
         )
@@ -71,51 +121,39 @@ class TestLeapYearEdgeCases:
 class TestFiscalYearBoundaries:
     """Tests for fiscal year boundary handling."""
 
-    def test_fiscal_year_start_date_calendar_year(self):
-        """Test fiscal year start for calendar year (Jan 1)."""
-        fy_start = EdgeCaseGenerator.fiscal_year_boundary_date(
-            year=2024,
-            fiscal_year_start_month=1,
-            is_start=True,
-        )
-
-        assert fy_start == date(2024, 1, 1)
-
-    def test_fiscal_year_end_date_calendar_year(self):
-        """Test fiscal year end for calendar year (Dec 31)."""
-        fy_end = EdgeCaseGenerator.fiscal_year_boundary_date(
-            year=2024,
-            fiscal_year_start_month=1,
-            is_start=False,
-        )
-
-        assert fy_end == date(2024, 12, 31)
-
-    def test_fiscal_year_start_date_mid_year(self):
-        """Test fiscal year start for mid-year fiscal year (July 1)."""
-        fy_start = EdgeCaseGenerator.fiscal_year_boundary_date(
-            year=2024,
-            fiscal_year_start_month=7,  # July
-            is_start=True,
-        )
-
-        assert fy_start == date(2024, 7, 1)
-
-    def test_fiscal_year_end_date_mid_year(self):
-        """Test fiscal year end for mid-year fiscal year (June 30)."""
-        fy_end = EdgeCaseGenerator.fiscal_year_boundary_date(
+    @pytest.mark.parametrize(
+        "fiscal_month,is_start,expected",
+        [
+            (1, True, date(2024, 1, 1)),  # Calendar year start (Jan 1)
+            (1, False, date(2024, 12, 31)),  # Calendar year end (Dec 31)
+            (7, True, date(2024, 7, 1)),  # Mid-year fiscal year start (July 1)
+            (7, False, date(2025, 6, 30)),  # July start -> June 30 end
+        ],
+    )
+    def test_fiscal_year_boundary_date(self, fiscal_month, is_start, expected):
+        """Test fiscal year start/end dates for calendar and mid-year fiscal years."""
+        boundary = EdgeCaseGenerator.fiscal_year_boundary_date(
             year=2024,
-            fiscal_year_start_month=7,  # July start -> June end
-            is_start=False,
+            fiscal_year_start_month=fiscal_month,
+            is_start=is_start,
         )
 
-        assert fy_end == date(2025, 6, 30)
+        assert boundary == expected
+
+    @pytest.mark.parametrize("fiscal_month", [0, 13, -1])
+    @pytest.mark.parametrize("is_start", [True, False])
+    def test_fiscal_year_boundary_date_rejects_invalid_month(self, fiscal_month, is_start):
+        """Test that a start month outside 1-12 is rejected (not wrapped by the month table)."""
+        with pytest.raises(ValueError, match="month must be in 1..12"):
+            EdgeCaseGenerator.fiscal_year_boundary_date(
+                year=2024,
+                fiscal_year_start_month=fiscal_month,
+                is_start=is_start,
+            )
 
     @pytest.mark.property
-    @given(
-        st.integers(min_value=2020, max_value=2030),
-        st.integers(min_value=1, max_value=12),
-    )
+    @small_domain_settings
+    @given(YEAR, MONTH)
     def test_fiscal_year_boundaries_are_consecutive(self, year, fiscal_month):
         """Property: Fiscal year end + 1 day = next fiscal year start."""
         fy_end = EdgeCaseGenerator.fiscal_year_boundary_date(
@@ -126,27 +164,15 @@ class TestFiscalYearBoundaries:
 
         next_fy_start = fy_end + timedelta(days=1)
 
-        # Next fiscal year start should match
-        expected_next_fy_start = EdgeCaseGenerator.fiscal_year_boundary_date(
-            year=year + 1 if fiscal_month > 1 else year,
-            fiscal_year_start_month=fiscal_month,
-            is_start=True,
-        )
-
-        # For fiscal years that cross calendar years, adjust expected year
-        if fiscal_month > 1:
-            expected_next_fy_start = date(year + 1, fiscal_month, 1)
-
-        assert next_fy_start.month == fiscal_month
-        assert next_fy_start.day == 1
+        # Every fiscal year (calendar or mid-year) ends the day before the
+        # start month comes round again in the following calendar year
+        assert next_fy_start == date(year + 1, fiscal_month, 1)
 
-    def test_fiscal_year_boundary_transaction_valid(self):
+    def test_fiscal_year_boundary_transaction_valid(self, property_id):
         """Test that transactions on fiscal year boundaries are valid."""
-        property = PropertyGenerator.create()
-
         # Transaction at fiscal year start
         fy_start_txn = EdgeCaseGenerator.fiscal_year_boundary_transaction(
-            property_id=property.id,
+            property_id=property_id,
             fiscal_year_start_month=7,  # July
             year=2024,
             is_year_start=True,
@@ -157,7 +183,7 @@ class TestFiscalYearBoundaries:
 
         # Transaction at fiscal year end
         fy_end_txn = EdgeCaseGenerator.fiscal_year_boundary_transaction(
-            property_id=property.id,
+            property_id=property_id,
             fiscal_year_start_month=7,
             year=2024,
             is_year_start=False,
@@ -170,43 +196,28 @@ class TestFiscalYearBoundaries:
 class TestRetroactiveCorrections:
     """Tests for retroactive correction handling."""
 
-    def test_retroactive_correction_pair_dates_ordered(self):
-        """Test that correction date is after original date."""
-        property = PropertyGenerator.create()
-
+    def test_retroactive_correction_pair(self, property_id):
+        """Test that correction date is after original date and amounts match."""
+        amount = Decimal("300.00")
         original, reversing = EdgeCaseGenerator.retroactive_correction_pair(
-            property_id=property.id,
+            property_id=property_id,
             original_date=date(2024, 1, 15),
             correction_date=date(2024, 2, 1),
-            amount=Decimal("300.00"),
+            amount=amount,
         )
 
         assert original.transaction_date == date(2024, 1, 15)
         assert reversing.transaction_date == date(2024, 2, 1)
         assert reversing.transaction_date > original.transaction_date
 
-    def test_retroactive_correction_same_amount(self):
-        """Test that correction has same amount as original."""
-        property = PropertyGenerator.create()
-
-        amount = Decimal("150.00")
-        original, reversing = EdgeCaseGenerator.retroactive_correction_pair(
-            property_id=property.id,
-            original_date=date(2024, 1, 15),
-            correction_date=date(2024, 2, 1),
-            amount=amount,
-        )
-
         assert original.amount == amount
         assert reversing.amount == amount
 
-    def test_retroactive_correction_invalid_dates_fails(self):
+    def test_retroactive_correction_invalid_dates_fails(self, property_id):
         """Test that correction before original fails."""
-        property = PropertyGenerator.create()
-
         with pytest.raises(ValueError, match="after original date"):
             EdgeCaseGenerator.retroactive_correction_pair(
-                property_id=property.id,
+                property_id=property_id,
                 original_date=date(2024, 2, 1),
                 correction_date=date(2024, 1, 15),  # Before original!
                 amount=Decimal("300.00"),
@@ -216,15 +227,13 @@ class TestRetroactiveCorrections:
 class TestPartialPayments:
     """Tests for partial payment scenarios."""
 
-    def test_partial_payment_less_than_due(self):
+    def test_partial_payment_less_than_due(self, property_id):
         """Test that partial payment is less than amount due."""
-        property = PropertyGenerator.create()
-
         amount_due = Decimal("300.00")
         amount_paid = Decimal("150.00")
 
         transaction = EdgeCaseGenerator.partial_payment_scenario(
-            property_id=property.id,
+            property_id=property_id,
             amount_due=amount_due,
             amount_paid=amount_paid,
         )
@@ -233,36 +242,35 @@ class TestPartialPayments:
         assert transaction.amount < amount_due
         assert TransactionValidator.validate_transaction(transaction)
 
-    def test_partial_payment_full_amount_fails(self):
+    def test_partial_payment_full_amount_fails(self, property_id):
         """Test that full payment is not considered partial."""
-        property = PropertyGenerator.create()
-
         amount_due = Decimal("300.00")
         amount_paid = Decimal("300.00")  # Full amount
 
         with pytest.raises(ValueError, match="less than amount due"):
             EdgeCaseGenerator.partial_payment_scenario(
-                property_id=property.id,
+                property_id=property_id,
                 amount_due=amount_due,
                 amount_paid=amount_paid,
             )
 
     @pytest.mark.property
+    @small_domain_settings
     @given(
-        st.decimals(min_value=100, max_value=1000, places=2),
-        st.decimals(min_value=1, max_value=99, places=2),
+        st.integers(min_value=100_00, max_value=1000_00),
+        st.integers(min_value=1_00, max_value=99_00),
     )
-    def test_partial_payment_always_valid(self, amount_due, partial_amount):
+    def test_partial_payment_always_valid(self, property_id, due_cents, partial_cents):
         """Property: For ANY amounts, partial payment < due is valid."""
-        property = PropertyGenerator.create()
-
-        amount_paid = amount_due - partial_amount  # Ensure partial
+        # Reject non-positive payments before building any Decimals
+        assume(partial_cents < due_cents)
 
-        if amount_paid <= Decimal("0.00"):
-            return  # Skip invalid amounts
+        # Integer cent draws are much cheaper than st.decimals
+        amount_due = cents_to_decimal(due_cents)
+        amount_paid = amount_due - cents_to_decimal(partial_cents)  # Ensure partial
 
         transaction = EdgeCaseGenerator.partial_payment_scenario(
-            property_id=property.id,
+            property_id=property_id,
             amount_due=amount_due,
             amount_paid=amount_paid,
         )
@@ -274,15 +282,13 @@ class TestPartialPayments:
 class TestOverpayments:
     """Tests for overpayment scenarios."""
 
-    def test_overpayment_greater_than_due(self):
+    def test_overpayment_greater_than_due(self, property_id):
         """Test that overpayment is greater than amount due."""
-        property = PropertyGenerator.create()
-
         amount_due = Decimal("300.00")
         amount_paid = Decimal("350.00")
 
         transaction = EdgeCaseGenerator.overpayment_scenario(
-            property_id=property.id,
+            property_id=property_id,
             amount_due=amount_due,
             amount_paid=amount_paid,
         )
@@ -291,16 +297,14 @@ class TestOverpayments:
         assert transaction.amount > amount_due
         assert TransactionValidator.validate_transaction(transaction)
 
-    def test_overpayment_exact_amount_fails(self):
+    def test_overpayment_exact_amount_fails(self, property_id):
         """Test that exact payment is not considered overpayment."""
-        property = PropertyGenerator.create()
-
         amount_due = Decimal("300.00")
         amount_paid = Decimal("300.00")  # Exact amount
 
         with pytest.raises(ValueError, match="greater than amount due"):
             EdgeCaseGenerator.overpayment_scenario(
-                property_id=property.id,
+                property_id=property_id,
                 amount_due=amount_due,
                 amount_paid=amount_paid,
             )
@@ -309,15 +313,13 @@ class TestOverpayments:
 class TestDateRangeTransactions:
     """Tests for transactions across date ranges."""
 
-    def test_date_range_transactions_spread_across_range(self):
+    def test_date_range_transactions_spread_across_range(self, property_id):
         """Test that transactions are spread across date range."""
-        property = PropertyGenerator.create()
-
         start_date = date(2024, 1, 1)
         end_date = date(2024, 12, 31)
 
         transactions = EdgeCaseGenerator.date_range_transactions(
-            property_id=property.id,
+            property_id=property_id,
             start_date=start_date,
             end_date=end_date,
             num_transactions=12,  # One per month
@@ -329,68 +331,53 @@ class TestDateRangeTransactions:
         for txn in transactions:
             assert start_date <= txn.transaction_date <= end_date
 
-        # Transactions should be in order
-        dates = [txn.transaction_date for txn in transactions]
-        assert dates == sorted(dates)
+        # Transactions should be in order (single pass over adjacent pairs)
+        assert all(
+            a.transaction_date <= b.transaction_date
+            for a, b in zip(transactions, transactions[1:])
+        )
 
-    def test_date_range_transactions_all_valid(self):
+    def test_date_range_transactions_all_valid(self, property_id):
         """Test that all transactions in range are valid."""
-        property = PropertyGenerator.create()
-
         start_date = date(2024, 1, 1)
         end_date = date(2024, 3, 31)
 
         transactions = EdgeCaseGenerator.date_range_transactions(
-            property_id=property.id,
+            property_id=property_id,
             start_date=start_date,
             end_date=end_date,
             num_transactions=10,
         )
 
-        for txn in transactions:
-            assert TransactionValidator.validate_transaction(txn)
+        results = TransactionValidator.validate_batch(transactions)
+
+        assert len(results) == len(transactions)
+        assert all(results)
 
 
 class TestMonthEndDates:
     """Tests for month-end date handling."""
 
-    def test_month_end_date_february_non_leap(self):
-        """Test February end in non-leap year (Feb 28)."""
-        month_end = EdgeCaseGenerator.month_end_date(2023, 2)
-        assert month_end == date(2023, 2, 28)
-
-    def test_month_end_date_february_leap(self):
-        """Test February end in leap year (Feb 29)."""
-        month_end = EdgeCaseGenerator.month_end_date(2024, 2)
-        assert month_end == date(2024, 2, 29)
-
-    def test_month_end_date_31_day_month(self):
-        """Test 31-day month (Jan, Mar, May, etc.)."""
-        month_end = EdgeCaseGenerator.month_end_date(2024, 1)
-        assert month_end == date(2024, 1, 31)
-
-    def test_month_end_date_30_day_month(self):
-        """Test 30-day month (Apr, Jun, Sep, Nov)."""
-        month_end = EdgeCaseGenerator.month_end_date(2024, 4)
-        assert month_end == date(2024, 4, 30)
-
-    @pytest.mark.property
-    @given(
-        st.integers(min_value=2020, max_value=2030),
-        st.integers(min_value=1, max_value=12),
+    @pytest.mark.parametrize(
+        "year,month,expected",
+        [
+            (2023, 2, date(2023, 2, 28)),  # February, non-leap year
+            (2024, 2, date(2024, 2, 29)),  # February, leap year
+            (2024, 1, date(2024, 1, 31)),  # 31-day month (Jan, Mar, May, etc.)
+            (2024, 4, date(2024, 4, 30)),  # 30-day month (Apr, Jun, Sep, Nov)
+        ],
+    )
+    def test_month_end_date(self, year, month, expected):
+        """Test month end dates for February (leap and non-leap), 30- and 31-day months."""
+        assert EdgeCaseGenerator.month_end_date(year, month) == expected
+
+    # Only 132 (year, month) pairs: enumerating them all beats sampling
+    @pytest.mark.parametrize(
+        "year,month",
+        [(year, month) for year in range(2020, 2031) for month in range(1, 13)],
     )
     def test_month_end_date_always_last_day(self, year, month):
-        """Property: Month end date + 1 day = first day of next month."""
+        """Test that month end date is the last calendar day of that month."""
         month_end = EdgeCaseGenerator.month_end_date(year, month)
 
-        next_day = month_end + timedelta(days=1)
-
-        # Next day should be first of next month
-        assert next_day.day == 1
-
-        if month == 12:
-            assert next_day.month == 1
-            assert next_day.year == year + 1
-        else:
-            assert next_day.month == month + 1
-            assert next_day.year == year
+        assert month_end == date(year, month, _last_day(year, month))
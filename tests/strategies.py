@@ -27,6 +27,25 @@ from qa_testing.models import (
 )
 
 
+# Numeric helpers shared by the property test modules
+def cents_to_decimal(cents):
+    """Convert integer cents to a 2-place Decimal amount (e.g. 15000 -> Decimal("150.00"))."""
+    return Decimal(cents).scaleb(-2)
+
+
+def has_two_places(amount):
+    """Return True if a Decimal carries exactly 2 decimal places (NUMERIC(15,2))."""
+    return amount.as_tuple()[2] == -2  # DecimalTuple.exponent
+
+
+def div_half_even(numerator, denominator):
+    """Integer division rounded half-to-even (Decimal.quantize's default rounding)."""
+    quotient, remainder = divmod(numerator, denominator)
+    if 2 * remainder > denominator or (2 * remainder == denominator and quotient % 2):
+        quotient += 1
+    return quotient
+
+
 # Basic strategies
 @st.composite
 def uuid_strategy(draw):
@@ -344,6 +344,24 @@ class TestGeneratedDataTypes:
             # Validate
             assert DataTypeValidator.validate_accounting_date(txn.transaction_date)
 
+    def test_generated_payment_batch_uses_decimal(self):
+        """Test that batched payments share tenant and amount as exact Decimals."""
+        property = PropertyGenerator.create()
+        payments = TransactionGenerator.create_payment_batch(
+            10,
+            property_id=property.id,
+            member_id=property.id,
+            amount=Decimal("300.00"),
+        )
+
+        assert len(payments) == 10
+        assert len({txn.tenant_id for txn in payments}) == 1
+
+        for txn in payments:
+            assert isinstance(txn.amount, Decimal)
+            assert txn.amount == Decimal("300.00")
+            assert DataTypeValidator.validate_money_amount(txn.amount)
+
     def test_generated_members_use_decimal(self):
         """Test that generated members use Decimal for balances."""
         property = PropertyGenerator.create()
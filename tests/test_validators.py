@@ -175,6 +175,24 @@ class TestTransactionValidator:
         with pytest.raises(ValidationError, match="wrong precision"):
             TransactionValidator.validate_transaction(transaction)
 
+    def test_validate_batch_applies_transaction_rules(self):
+        """Test that batch validation applies the single-transaction rules to each item."""
+        property = PropertyGenerator.create()
+        transactions = TransactionGenerator.create_payment_batch(
+            3,
+            property_id=property.id,
+            member_id=property.id,
+            amount=Decimal("300.00"),
+        )
+
+        assert TransactionValidator.validate_batch(transactions) == [True, True, True]
+
+        # Corrupt the last transaction
+        transactions[-1].amount = Decimal("-100.00")
+
+        with pytest.raises(ValidationError, match="non-positive amount"):
+            TransactionValidator.validate_batch(transactions)
+
     def test_validates_payment_balance_update(self):
         """Test that payment balance update is validated correctly."""
         property = PropertyGenerator.create()